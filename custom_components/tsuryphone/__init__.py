@@ -15,7 +15,11 @@ from urllib.parse import urlparse
 
 from .api_client import TsuryPhoneAPIClient, TsuryPhoneAPIError
 from .coordinator import TsuryPhoneDataUpdateCoordinator
-from .services import async_setup_services, async_unload_services
+from .services import (
+    async_forget_coordinator,
+    async_setup_services,
+    async_unload_services,
+)
 from .notifications import async_setup_notifications, async_unload_notifications
 from .storage_cache import TsuryPhoneStorageCache
 from .const import (
@@ -176,15 +180,14 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Create and initialize coordinator
     _LOGGER.info("========== CREATING COORDINATOR ==========")
     coordinator = TsuryPhoneDataUpdateCoordinator(hass, api_client, device_info)
-    _LOGGER.info("Coordinator created, data state: %s", coordinator.data)
+    _LOGGER.debug("Coordinator created, data state: %s", coordinator.data)
 
     # Phase P7: Set up storage cache BEFORE first refresh
-    _LOGGER.info("========== SETTING UP STORAGE CACHE ==========")
     storage_cache = TsuryPhoneStorageCache(hass, device_info.device_id)
-    _LOGGER.info("Storage cache instance created for device: %s", device_info.device_id)
+    _LOGGER.debug("Storage cache instance created for device: %s", device_info.device_id)
 
     await storage_cache.async_initialize()
-    _LOGGER.info("Storage cache initialized")
+    _LOGGER.debug("Storage cache initialized")
 
     # Apply retention settings from options
     options_advanced = entry.options.get("advanced", {})
@@ -198,7 +201,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         )
 
     coordinator._storage_cache = storage_cache
-    _LOGGER.info("Storage cache attached to coordinator")
+    _LOGGER.debug("Storage cache attached to coordinator")
 
     # Initialize state and load cached data BEFORE first refresh
     coordinator._ensure_state()
@@ -207,13 +210,13 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     try:
         cached_call_history = await storage_cache.async_load_call_history()
         if cached_call_history is not None:
-            coordinator.data.call_history = cached_call_history
+            coordinator.data.set_call_history(cached_call_history)
     except Exception as err:
         _LOGGER.error("Failed to load cached call history: %s", err, exc_info=True)
 
     # Load cached device state (including send_mode)
     try:
-        cached_device_state = await storage_cache.async_load_device_state()
+        cached_device_state = await storage_cache.async_peek_device_state()
         if cached_device_state:
             coordinator.apply_cached_device_state(cached_device_state)
     except Exception as err:
@@ -267,6 +270,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             if hasattr(coordinator, "_notification_manager"):
                 await async_unload_notifications(hass, coordinator)
 
+            async_forget_coordinator(hass, coordinator)
             await coordinator.async_shutdown()
 
         # Unload services if this is the last config entry
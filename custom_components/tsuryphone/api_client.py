@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+from functools import lru_cache
 import json
 import logging
 from typing import Any
@@ -10,6 +11,8 @@ from typing import Any
 import aiohttp
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.json import json_bytes
+from homeassistant.util.json import json_loads
 
 from .const import (
     API_CONFIG_TSURYPHONE,
@@ -33,11 +36,13 @@ from .const import (
     API_CALL_DIAL_QUICK_DIAL,
     API_CONFIG_QUICK_DIAL_ADD,
     API_CONFIG_QUICK_DIAL_REMOVE,
+    API_CONFIG_QUICK_DIAL_BULK_ADD,
     API_CONFIG_EDIT_CONTACT,
     API_CONFIG_WEBHOOK_ADD,
     API_CONFIG_WEBHOOK_REMOVE,
     API_CONFIG_BLOCKED_ADD,
     API_CONFIG_BLOCKED_REMOVE,
+    API_CONFIG_BLOCKED_BULK_ADD,
     API_CONFIG_HA_URL,
     API_CONFIG_PRIORITY_ADD,
     API_CONFIG_PRIORITY_REMOVE,
@@ -58,14 +63,32 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# HTTP statuses returned by firmware that predates an endpoint
+_UNSUPPORTED_ENDPOINT_STATUSES = frozenset({404, 501})
+
+
+@lru_cache(maxsize=64)
+def _webhook_action_body(code: str, webhook_id: str, action_name: str) -> bytes:
+    """Return the encoded webhook add payload, reused for repeated registrations."""
+    data = {"code": code, "id": webhook_id}
+    if action_name:
+        data["actionName"] = action_name
+    return json_bytes(data)
+
 
 class TsuryPhoneAPIError(Exception):
     """Exception for API errors."""
 
-    def __init__(self, message: str, error_code: str | None = None) -> None:
+    def __init__(
+        self,
+        message: str,
+        error_code: str | None = None,
+        status: int | None = None,
+    ) -> None:
         """Initialize API error."""
         super().__init__(message)
         self.error_code = error_code
+        self.status = status
 
 
 class TsuryPhoneAPIClient:
@@ -91,9 +114,17 @@ class TsuryPhoneAPIClient:
         return f"ws://{self._host}:{self._port}/ws"
 
     async def _request(
-        self, method: str, endpoint: str, data: dict[str, Any] | None = None
+        self,
+        method: str,
+        endpoint: str,
+        data: dict[str, Any] | None = None,
+        *,
+        body: bytes | None = None,
     ) -> dict[str, Any]:
-        """Make HTTP request to device."""
+        """Make HTTP request to device.
+
+        ``body`` may carry an already JSON-encoded POST payload instead of ``data``.
+        """
         url = f"{self._base_url}{endpoint}"
 
         try:
@@ -103,9 +134,13 @@ class TsuryPhoneAPIClient:
                         return await self._handle_response(response, endpoint)
                 elif method.upper() == "POST":
                     headers = {"Content-Type": "application/json"}
-                    async with self._session.post(
-                        url, json=data or {}, headers=headers
-                    ) as response:
+                    if body is not None:
+                        request = self._session.post(url, data=body, headers=headers)
+                    else:
+                        request = self._session.post(
+                            url, json=data or {}, headers=headers
+                        )
+                    async with request as response:
                         return await self._handle_response(response, endpoint)
                 else:
                     raise ValueError(f"Unsupported HTTP method: {method}")
@@ -122,8 +157,12 @@ class TsuryPhoneAPIClient:
     ) -> dict[str, Any]:
         """Handle HTTP response from device."""
         try:
-            response_data = await response.json()
-        except json.JSONDecodeError as err:
+            response_data = await response.json(loads=json_loads)
+        except (json.JSONDecodeError, aiohttp.ContentTypeError) as err:
+            if response.status != 200:
+                raise TsuryPhoneAPIError(
+                    f"HTTP {response.status}", status=response.status
+                ) from err
             _LOGGER.error("Invalid JSON response from %s: %s", endpoint, err)
             raise TsuryPhoneAPIError("Invalid JSON response") from err
 
@@ -133,7 +172,9 @@ class TsuryPhoneAPIClient:
             # Firmware sends "message" field, not "errorMessage"
             if response_data and "message" in response_data:
                 error_msg = response_data["message"]
-            raise TsuryPhoneAPIError(error_msg, response_data.get("errorCode"))
+            raise TsuryPhoneAPIError(
+                error_msg, response_data.get("errorCode"), response.status
+            )
 
         # Check device success response
         if not response_data.get("success", True):
@@ -338,6 +379,20 @@ class TsuryPhoneAPIClient:
         )
         return await self._request("POST", API_CONFIG_QUICK_DIAL_ADD, data)
 
+    async def add_quick_dials_bulk(
+        self, entries: list[dict[str, str]], clear: bool = False
+    ) -> dict[str, Any]:
+        """Add several quick dial entries in a single request.
+
+        The device replies with ``added`` codes and ``failed`` entries. Older
+        firmware without the endpoint answers 404/501.
+        """
+        return await self._request(
+            "POST",
+            API_CONFIG_QUICK_DIAL_BULK_ADD,
+            {"entries": entries, "clear": clear},
+        )
+
     async def remove_quick_dial_by_id(self, entry_id: str) -> dict[str, Any]:
         """Remove quick dial entry by ID."""
         return await self._request(
@@ -382,6 +437,20 @@ class TsuryPhoneAPIClient:
 
         return await self._request("POST", API_CONFIG_BLOCKED_ADD, data)
 
+    async def add_blocked_numbers_bulk(
+        self, entries: list[dict[str, str]], clear: bool = False
+    ) -> dict[str, Any]:
+        """Add several blocked numbers in a single request.
+
+        The device replies with ``added`` numbers and ``failed`` entries. Older
+        firmware without the endpoint answers 404/501.
+        """
+        return await self._request(
+            "POST",
+            API_CONFIG_BLOCKED_BULK_ADD,
+            {"entries": entries, "clear": clear},
+        )
+
     async def remove_blocked_number_by_id(self, entry_id: str) -> dict[str, Any]:
         """Remove blocked number by ID."""
         if not entry_id:
@@ -412,10 +481,11 @@ class TsuryPhoneAPIClient:
         if not code or not code.isdigit():
             raise TsuryPhoneAPIError("Webhook code must contain only digits (0-9)")
         
-        data = {"code": code, "id": webhook_id}
-        if action_name:
-            data["actionName"] = action_name
-        return await self._request("POST", API_CONFIG_WEBHOOK_ADD, data)
+        return await self._request(
+            "POST",
+            API_CONFIG_WEBHOOK_ADD,
+            body=_webhook_action_body(code, webhook_id, action_name),
+        )
 
     async def remove_webhook_action(self, code: str) -> dict[str, Any]:
         """Remove webhook action."""
@@ -436,6 +506,30 @@ class TsuryPhoneAPIClient:
             isinstance(error, TsuryPhoneAPIError) and error.error_code == expected_code
         )
 
+    def is_unsupported_endpoint(self, error: Exception) -> bool:
+        """Check if exception means the firmware lacks the requested endpoint."""
+        return (
+            isinstance(error, TsuryPhoneAPIError)
+            and error.status in _UNSUPPORTED_ENDPOINT_STATUSES
+        )
+
+    def is_server_error(self, error: Exception) -> bool:
+        """Check if the device answered with a 5xx, i.e. it rejected the request."""
+        return (
+            isinstance(error, TsuryPhoneAPIError)
+            and error.status is not None
+            and error.status >= 500
+            and error.status not in _UNSUPPORTED_ENDPOINT_STATUSES
+        )
+
+    def is_transient_error(self, error: Exception) -> bool:
+        """Check if exception is a connection or server failure worth retrying."""
+        if not isinstance(error, TsuryPhoneAPIError):
+            return False
+        if error.status is not None:
+            return self.is_server_error(error)
+        return isinstance(error.__cause__, (aiohttp.ClientError, asyncio.TimeoutError))
+
     async def test_connection(self) -> bool:
         """Test if device is reachable."""
         try:
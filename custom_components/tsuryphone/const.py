@@ -8,6 +8,9 @@ DOMAIN: Final = "tsuryphone"
 MANUFACTURER: Final = "TsuryTech"
 MODEL: Final = "TsuryPhone"
 
+# hass.data keys
+DATA_COORDINATORS_BY_DEVICE: Final = "by_device_id"
+
 # Network configuration
 DEFAULT_PORT: Final = 8080
 WEBSOCKET_PATH: Final = "/ws"
@@ -23,13 +26,20 @@ MDNS_DEVICE_TYPE: Final = "tsuryphone"
 # Timing constants (milliseconds)
 WEBSOCKET_RECONNECT_DELAY: Final = 5000  # 5 seconds
 WEBSOCKET_MAX_BACKOFF: Final = 60000  # 60 seconds
+WEBSOCKET_RECONNECT_SERVICE_TIMEOUT: Final = 2.0  # seconds
 POLLING_FALLBACK_INTERVAL: Final = 30  # 30 seconds
 REFETCH_INTERVAL_DEFAULT: Final = 300  # 5 minutes
 
 # Event processing
 EVENT_HISTORY_SIZE_DEFAULT: Final = 300
-EVENT_QUEUE_MAX_SIZE: Final = 500
 SERVICE_CONCURRENCY_LIMIT: Final = 4
+SERVICE_MAX_CONCURRENCY: Final = 10
+SERVICE_EXECUTOR_THRESHOLD: Final = 500  # entries
+IMPORT_CHUNK_SIZE: Final = 50  # entries
+CALL_HISTORY_SAVE_DELAY: Final = 0.5  # seconds
+BULK_REFRESH_COOLDOWN: Final = 0.5  # seconds
+BULK_RETRY_ATTEMPTS: Final = 3
+BULK_RETRY_BASE_DELAY: Final = 0.1  # seconds
 
 # Validation limits (from firmware Validation.h)
 MAX_CODE_LENGTH: Final = 16
@@ -155,6 +165,7 @@ HA_EVENT_SYSTEM: Final = "tsuryphone_system_{}"  # Format with event type
 HA_EVENT_CONFIG_DELTA: Final = "tsuryphone_config_delta"
 HA_EVENT_DIAGNOSTIC_SNAPSHOT: Final = "tsuryphone_diagnostic_snapshot"
 HA_EVENT_WEBHOOK_ACTION: Final = "tsuryphone_webhook_action"
+HA_EVENT_BULK_IMPORT_COMPLETE: Final = "tsuryphone_bulk_import_complete"
 
 # Configuration keys for options flow
 CONF_HOST_OVERRIDE: Final = "host_override"
@@ -211,11 +222,13 @@ API_CONFIG_DIALING: Final = "/api/config/dialing"
 API_CALL_DIAL_QUICK_DIAL: Final = "/api/call/dial_quick_dial"
 API_CONFIG_QUICK_DIAL_ADD: Final = "/api/config/quick_dial_add"
 API_CONFIG_QUICK_DIAL_REMOVE: Final = "/api/config/quick_dial_remove"
+API_CONFIG_QUICK_DIAL_BULK_ADD: Final = "/api/config/quick_dial_bulk_add"
 API_CONFIG_EDIT_CONTACT: Final = "/api/config/edit_contact"
 API_CONFIG_WEBHOOK_ADD: Final = "/api/config/webhook_add"
 API_CONFIG_WEBHOOK_REMOVE: Final = "/api/config/webhook_remove"
 API_CONFIG_BLOCKED_ADD: Final = "/api/config/blocked_add"
 API_CONFIG_BLOCKED_REMOVE: Final = "/api/config/blocked_remove"
+API_CONFIG_BLOCKED_BULK_ADD: Final = "/api/config/blocked_bulk_add"
 API_CONFIG_HA_URL: Final = "/api/config/ha_url"
 API_CONFIG_PRIORITY_ADD: Final = "/api/config/priority_add"
 API_CONFIG_PRIORITY_REMOVE: Final = "/api/config/priority_remove"
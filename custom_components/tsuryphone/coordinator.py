@@ -11,8 +11,9 @@ from datetime import datetime, timedelta
 from typing import Any
 
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
-from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.event import async_call_later, async_track_time_interval
 from homeassistant.util import dt as dt_util
 
 from .api_client import TsuryPhoneAPIClient, TsuryPhoneAPIError
@@ -24,7 +25,7 @@ from .dialing import (
 )
 from .websocket import TsuryPhoneWebSocketClient
 from .storage_cache import TsuryPhoneStorageCache
-from .resilience import TsuryPhoneResilience
+from .resilience import AsyncCaller, TsuryPhoneResilience
 from .models import (
     TsuryPhoneState,
     TsuryPhoneEvent,
@@ -37,9 +38,14 @@ from .models import (
     WebhookEntry,
 )
 from .const import (
+    BULK_REFRESH_COOLDOWN,
+    BULK_RETRY_ATTEMPTS,
+    BULK_RETRY_BASE_DELAY,
+    CALL_HISTORY_SAVE_DELAY,
     DOMAIN,
     POLLING_FALLBACK_INTERVAL,
     REFETCH_INTERVAL_DEFAULT,
+    SERVICE_MAX_CONCURRENCY,
     AppState,
     EventCategory,
     CallEvent,
@@ -84,6 +90,24 @@ class TsuryPhoneDataUpdateCoordinator(DataUpdateCoordinator[TsuryPhoneState]):
         # Initialize state after base class sets default data
         self.data = TsuryPhoneState(device_info=device_info)
 
+        # Trailing refresh shared by bulk services so back-to-back calls
+        # collapse into a single config fetch
+        self._bulk_refresh_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=BULK_REFRESH_COOLDOWN,
+            immediate=False,
+            function=self.async_refresh,
+        )
+
+        # Device-wide gate for bulk service calls, retrying transient failures
+        self.api_caller = AsyncCaller(
+            SERVICE_MAX_CONCURRENCY,
+            BULK_RETRY_ATTEMPTS,
+            BULK_RETRY_BASE_DELAY,
+            api_client.is_transient_error,
+        )
+
         # WebSocket client
         self._websocket_client: TsuryPhoneWebSocketClient | None = None
         self._websocket_enabled = True
@@ -131,6 +155,7 @@ class TsuryPhoneDataUpdateCoordinator(DataUpdateCoordinator[TsuryPhoneState]):
 
         # Phase P7: Storage cache
         self._storage_cache: TsuryPhoneStorageCache | None = None
+        self._pending_history_save: Any = None
 
         # Phase P8: Resilience management
         self._resilience: TsuryPhoneResilience | None = None
@@ -148,7 +173,9 @@ class TsuryPhoneDataUpdateCoordinator(DataUpdateCoordinator[TsuryPhoneState]):
             self.data = TsuryPhoneState(device_info=self.device_info)
         return self.data
 
-    def apply_cached_device_state(self, cached_state: dict[str, Any] | None) -> None:
+    def apply_cached_device_state(
+        self, cached_state: Mapping[str, Any] | None
+    ) -> None:
         """Hydrate coordinator state from cached persistent data."""
         if not cached_state:
             return
@@ -2231,6 +2258,18 @@ class TsuryPhoneDataUpdateCoordinator(DataUpdateCoordinator[TsuryPhoneState]):
                 if key:
                     self._apply_config_change(key, new_value)
 
+    @callback
+    def async_apply_local_config(self, changes: Mapping[str, Any]) -> None:
+        """Apply configuration values already accepted by the device.
+
+        Keys use the same firmware names as config delta events, so a
+        successful write can be reflected without refetching the full config.
+        """
+        self._ensure_state()
+        for key, value in changes.items():
+            self._apply_config_change(key, value)
+        self.async_set_updated_data(self.data)
+
     def _update_default_dialing_metadata(
         self,
         *,
@@ -2340,10 +2379,10 @@ class TsuryPhoneDataUpdateCoordinator(DataUpdateCoordinator[TsuryPhoneState]):
                         display_number=display_number,
                     )
                     # Remove any existing entry with same id
-                    self.data.quick_dials = [
-                        q for q in self.data.quick_dials if q.id != entry.id
-                    ]
-                    self.data.quick_dials.append(entry)
+                    self.data.set_quick_dials(
+                        [q for q in self.data.quick_dials if q.id != entry.id]
+                        + [entry]
+                    )
                     self._ensure_quick_dial_selection()
                 except (ValueError, KeyError) as err:
                     _LOGGER.warning("Invalid quick dial entry in config delta: %s", err)
@@ -2356,9 +2395,9 @@ class TsuryPhoneDataUpdateCoordinator(DataUpdateCoordinator[TsuryPhoneState]):
                     entry_id = value
 
                 if entry_id:
-                    self.data.quick_dials = [
-                        q for q in self.data.quick_dials if q.id != entry_id
-                    ]
+                    self.data.set_quick_dials(
+                        [q for q in self.data.quick_dials if q.id != entry_id]
+                    )
                     self._ensure_quick_dial_selection()
         elif key.startswith("blocked."):
             # Blocked numbers list changes
@@ -2378,10 +2417,10 @@ class TsuryPhoneDataUpdateCoordinator(DataUpdateCoordinator[TsuryPhoneState]):
                         display_number=display_number,
                     )
                     # Remove any existing entry with same id
-                    self.data.blocked_numbers = [
-                        b for b in self.data.blocked_numbers if b.id != entry.id
-                    ]
-                    self.data.blocked_numbers.append(entry)
+                    self.data.set_blocked_numbers(
+                        [b for b in self.data.blocked_numbers if b.id != entry.id]
+                        + [entry]
+                    )
                     self._ensure_blocked_selection()
                 except (ValueError, KeyError) as err:
                     _LOGGER.warning(
@@ -2389,9 +2428,9 @@ class TsuryPhoneDataUpdateCoordinator(DataUpdateCoordinator[TsuryPhoneState]):
                     )
             elif action == "remove" and isinstance(value, str):
                 # Remove blocked number by ID (firmware sends ID as string)
-                self.data.blocked_numbers = [
-                    b for b in self.data.blocked_numbers if b.id != value
-                ]
+                self.data.set_blocked_numbers(
+                    [b for b in self.data.blocked_numbers if b.id != value]
+                )
                 self._ensure_blocked_selection()
         elif key.startswith("webhook."):
             # Webhook configuration changes
@@ -2712,7 +2751,7 @@ class TsuryPhoneDataUpdateCoordinator(DataUpdateCoordinator[TsuryPhoneState]):
                         _LOGGER.debug(
                             "Skipping invalid quick dial snapshot entry: %s", q
                         )
-            self.data.quick_dials = qd_list
+            self.data.set_quick_dials(qd_list)
             self._ensure_quick_dial_selection()
 
             blocked_source = (
@@ -2749,7 +2788,7 @@ class TsuryPhoneDataUpdateCoordinator(DataUpdateCoordinator[TsuryPhoneState]):
                         )
                     except Exception:  # noqa: BLE001
                         _LOGGER.debug("Skipping invalid blocked snapshot entry: %s", b)
-            self.data.blocked_numbers = blocked_list
+            self.data.set_blocked_numbers(blocked_list)
             self._ensure_blocked_selection()
 
             # Try priorityCallerDetails first (new format with IDs), fall back to priorityCallers (old format)
@@ -3794,7 +3833,7 @@ class TsuryPhoneDataUpdateCoordinator(DataUpdateCoordinator[TsuryPhoneState]):
                         )
                     except Exception:  # noqa: BLE001
                         _LOGGER.debug("Skipping invalid quick dial config entry: %s", q)
-                self.data.quick_dials = qd_list
+                self.data.set_quick_dials(qd_list)
                 self._ensure_quick_dial_selection()
 
             # Blocked number entries
@@ -3828,7 +3867,7 @@ class TsuryPhoneDataUpdateCoordinator(DataUpdateCoordinator[TsuryPhoneState]):
                         )
                     except Exception:  # noqa: BLE001
                         _LOGGER.debug("Skipping invalid blocked config entry: %s", b)
-                self.data.blocked_numbers = blocked_list
+                self.data.set_blocked_numbers(blocked_list)
                 self._ensure_blocked_selection()
 
             # Webhook entries
@@ -4469,6 +4508,36 @@ class TsuryPhoneDataUpdateCoordinator(DataUpdateCoordinator[TsuryPhoneState]):
 
         return dt_value.isoformat()
 
+    async def async_request_refresh_debounced(self) -> None:
+        """Request a refresh that is coalesced with other pending requests."""
+        await self._bulk_refresh_debouncer.async_call()
+
+    @callback
+    def async_schedule_refresh_debounced(self) -> None:
+        """Schedule a coalesced refresh without waiting on the debouncer."""
+        self._bulk_refresh_debouncer.async_schedule_call()
+
+    @callback
+    def _schedule_history_save(self) -> None:
+        """Coalesce call history writes into a single delayed save."""
+        if not self._storage_cache:
+            return
+
+        if self._pending_history_save:
+            self._pending_history_save()
+
+        self._pending_history_save = async_call_later(
+            self.hass, CALL_HISTORY_SAVE_DELAY, self._async_flush_history_save
+        )
+
+    async def _async_flush_history_save(self, _now: Any = None) -> None:
+        """Persist the current call history to the storage cache."""
+        self._pending_history_save = None
+        if self._storage_cache and self.data:
+            await self._storage_cache.async_save_call_history(
+                list(self.data.call_history or [])
+            )
+
     async def _refetch_after_reboot(self) -> None:
         """Refetch device state after reboot detection."""
         try:
@@ -4496,7 +4565,13 @@ class TsuryPhoneDataUpdateCoordinator(DataUpdateCoordinator[TsuryPhoneState]):
             await self._resilience.cleanup()
             self._resilience = None
 
+        self._bulk_refresh_debouncer.async_shutdown()
+
         # Phase P7: Final storage cache save and cleanup
+        if self._pending_history_save:
+            self._pending_history_save()
+            self._pending_history_save = None
+
         if self._storage_cache:
             try:
                 if self.data:
@@ -4507,6 +4582,7 @@ class TsuryPhoneDataUpdateCoordinator(DataUpdateCoordinator[TsuryPhoneState]):
                         self.data, self._send_mode_enabled
                     )
                 await self._storage_cache.async_cleanup_storage()
+                await self._storage_cache.async_flush()
                 _LOGGER.debug("Storage cache saved and cleaned up")
             except Exception as err:
                 _LOGGER.error("Failed to save storage cache during shutdown: %s", err)
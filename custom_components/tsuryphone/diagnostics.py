@@ -427,7 +427,7 @@ def get_diagnostic_summary(
             "uptime_hours": round(state.stats.uptime_seconds / 3600, 1),
             "signal_dbm": state.stats.rssi_dbm if state.stats.rssi_dbm != 0 else None,
             "total_calls": state.stats.calls_total,
-            "missed_calls": len([c for c in (state.call_history or []) if c.missed]),
+            "missed_calls": len(state.missed_calls),
             "websocket_connected": (
                 coordinator._websocket_client.connected
                 if coordinator._websocket_client
@@ -477,7 +477,7 @@ def _get_diagnostic_recommendations(
             "Device in maintenance mode - normal operations may be affected"
         )
 
-    recent_missed_calls = len([c for c in (state.call_history or []) if c.missed])
+    recent_missed_calls = len(state.missed_calls)
     if recent_missed_calls > 5:
         recommendations.append(
             f"{recent_missed_calls} recent missed calls - check DND settings and device availability"
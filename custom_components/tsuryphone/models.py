@@ -197,7 +197,7 @@ class DeviceStats:
     rssi_dbm: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class CallHistoryEntry:
     """Single call history entry.
     
@@ -342,9 +342,19 @@ class TsuryPhoneState:
     # Call history (rolling buffer)
     call_history: list[CallHistoryEntry] = field(default_factory=list)
     call_history_capacity: int = 500
+    # Missed-call subset of call_history, kept in sync by the history helpers
+    missed_calls: list[CallHistoryEntry] = field(default_factory=list)
     call_state_revision: int = 0
     call_state_updated_at: float = field(default_factory=time.time)
 
+    # Export payloads, dropped by set_quick_dials()/set_blocked_numbers()
+    _quick_dial_export: tuple[dict[str, str], ...] | None = field(
+        default=None, repr=False, compare=False
+    )
+    _blocked_export: tuple[dict[str, str], ...] | None = field(
+        default=None, repr=False, compare=False
+    )
+
     # State derived properties
     @property
     def is_call_active(self) -> bool:
@@ -421,10 +431,53 @@ class TsuryPhoneState:
     def add_call_history_entry(self, entry: CallHistoryEntry) -> None:
         """Add entry to call history with capacity management."""
         self.call_history.append(entry)
+        if entry.missed:
+            self.missed_calls.append(entry)
 
         # Enforce capacity limit (newest entries kept)
-        if len(self.call_history) > self.call_history_capacity:
-            self.call_history = self.call_history[-self.call_history_capacity :]
+        overflow = len(self.call_history) - self.call_history_capacity
+        if overflow > 0:
+            dropped_missed = sum(
+                1 for dropped in self.call_history[:overflow] if dropped.missed
+            )
+            if dropped_missed:
+                del self.missed_calls[:dropped_missed]
+            self.call_history = self.call_history[overflow:]
+
+    def set_call_history(self, entries: list[CallHistoryEntry]) -> None:
+        """Replace the call history and rebuild the missed-call index."""
+        self.call_history = entries
+        self.missed_calls = [entry for entry in entries if entry.missed]
+
+    def set_quick_dials(self, entries: list[QuickDialEntry]) -> None:
+        """Replace the quick dial list and drop its cached export."""
+        self.quick_dials = entries
+        self._quick_dial_export = None
+
+    def set_blocked_numbers(self, entries: list[BlockedNumberEntry]) -> None:
+        """Replace the blocked number list and drop its cached export."""
+        self.blocked_numbers = entries
+        self._blocked_export = None
+
+    def quick_dial_export(self) -> list[dict[str, str]]:
+        """Return quick dials as export dicts, reusing the last build if unchanged."""
+        cached = self._quick_dial_export
+        if cached is None:
+            cached = self._quick_dial_export = tuple(
+                {"code": entry.code, "number": entry.number, "name": entry.name}
+                for entry in self.quick_dials
+            )
+        return [dict(entry) for entry in cached]
+
+    def blocked_export(self) -> list[dict[str, str]]:
+        """Return blocked numbers as export dicts, reusing the last build if unchanged."""
+        cached = self._blocked_export
+        if cached is None:
+            cached = self._blocked_export = tuple(
+                {"number": entry.number, "name": entry.name}
+                for entry in self.blocked_numbers
+            )
+        return [dict(entry) for entry in cached]
 
     def get_quick_dial_by_code(self, code: str) -> QuickDialEntry | None:
         """Find quick dial entry by code."""
@@ -462,7 +515,7 @@ class TsuryPhoneState:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class TsuryPhoneEvent:
     """Represents a device event from WebSocket or generated internally."""
 
@@ -475,6 +528,8 @@ class TsuryPhoneEvent:
     event: str
     data: dict[str, Any] = field(default_factory=dict)
     received_at: float = field(default_factory=time.time)
+    # Set by the resilience manager when the event follows a device reboot
+    _reboot_detected: bool = field(default=False, init=False, repr=False)
 
     @classmethod
     def from_json(cls, data: dict[str, Any]) -> TsuryPhoneEvent:
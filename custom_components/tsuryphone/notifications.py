@@ -242,10 +242,10 @@ class TsuryPhoneNotificationManager:
         missed_calls_count = 0
         recent_missed_calls = []
 
-        if state.call_history:
+        if state.missed_calls:
             cutoff_time = dt_util.utcnow() - timedelta(hours=24)
-            for call in state.call_history:
-                if call.missed and call.timestamp and call.timestamp > cutoff_time:
+            for call in state.missed_calls:
+                if call.timestamp and call.timestamp > cutoff_time:
                     missed_calls_count += 1
                     recent_missed_calls.append(call)
 
@@ -4,7 +4,8 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Any, Callable
+from collections.abc import Awaitable
+from typing import Any, Callable, TypeVar
 from datetime import datetime, timedelta
 from dataclasses import dataclass
 
@@ -16,6 +17,8 @@ from .models import TsuryPhoneEvent, TsuryPhoneState
 
 _LOGGER = logging.getLogger(__name__)
 
+_R = TypeVar("_R")
+
 # Sequence overflow handling
 SEQUENCE_MAX_VALUE = 2**32 - 1  # 32-bit unsigned integer max
 SEQUENCE_RESET_THRESHOLD = SEQUENCE_MAX_VALUE - 1000
@@ -28,6 +31,60 @@ REBOOT_DETECTION_TIMEOUT = 300  # 5 minutes to confirm reboot
 REBOOT_RECOVERY_DELAY = 10  # Wait 10 seconds before recovery actions
 
 
+class AsyncCaller:
+    """Run device calls with bounded concurrency, retrying transient failures.
+
+    Failures for which ``retry_if`` returns False (e.g. validation or 4xx
+    errors) are raised immediately.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        max_retries: int,
+        base_delay: float,
+        retry_if: Callable[[Exception], bool],
+    ) -> None:
+        """Initialize caller."""
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._max_retries = max_retries
+        self._base_delay = base_delay
+        self._retry_if = retry_if
+
+    async def call(
+        self,
+        func: Callable[..., Awaitable[_R]],
+        *args: Any,
+        retry_if: Callable[[Exception], bool] | None = None,
+    ) -> _R:
+        """Await ``func(*args)``, backing off exponentially between retries.
+
+        ``retry_if`` overrides the caller-wide predicate, e.g. for requests
+        that must not be replayed after a timeout. The concurrency slot is
+        held per attempt, so a call that is backing off does not block others.
+        """
+        should_retry = retry_if or self._retry_if
+        attempt = 1
+        while True:
+            try:
+                async with self._semaphore:
+                    return await func(*args)
+            except Exception as err:
+                if attempt >= self._max_retries or not should_retry(err):
+                    raise
+                delay = self._base_delay * 2 ** (attempt - 1)
+                _LOGGER.debug(
+                    "Transient error from %s (attempt %d/%d), retrying in %.1fs: %s",
+                    getattr(func, "__name__", func),
+                    attempt,
+                    self._max_retries,
+                    delay,
+                    err,
+                )
+            await asyncio.sleep(delay)
+            attempt += 1
+
+
 @dataclass
 class ResilienceStats:
     """Statistics for resilience monitoring."""
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import operator
 import time
-from collections.abc import Mapping
+from collections.abc import Awaitable, Callable, Iterable, Mapping
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Final, TypeVar
 
 import voluptuous as vol
 from homeassistant.core import (
@@ -14,6 +16,7 @@ from homeassistant.core import (
     ServiceCall,
     ServiceResponse,
     SupportsResponse,
+    callback,
 )
 from homeassistant.helpers import (
     config_validation as cv,
@@ -24,6 +27,7 @@ from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
 
 from .const import (
     DOMAIN,
+    DATA_COORDINATORS_BY_DEVICE,
     SERVICE_DIAL,
     SERVICE_DIAL_DIGIT,
     SERVICE_SEND_DTMF,
@@ -72,6 +76,12 @@ from .const import (
     SERVICE_WEBSOCKET_RECONNECT,
     SERVICE_RUN_HEALTH_CHECK,
     INTEGRATION_EVENT_SCHEMA_VERSION,
+    SERVICE_CONCURRENCY_LIMIT,
+    SERVICE_MAX_CONCURRENCY,
+    SERVICE_EXECUTOR_THRESHOLD,
+    IMPORT_CHUNK_SIZE,
+    HA_EVENT_BULK_IMPORT_COMPLETE,
+    WEBSOCKET_RECONNECT_SERVICE_TIMEOUT,
     AUDIO_MIN_LEVEL,
     AUDIO_MAX_LEVEL,
     RING_PATTERN_PRESETS,
@@ -80,9 +90,34 @@ from .const import (
 from .coordinator import TsuryPhoneDataUpdateCoordinator
 from .api_client import TsuryPhoneAPIError
 from .dialing import DialingContext, sanitize_default_dialing_code
+from .models import CallHistoryEntry, TsuryPhoneEvent
 
 _LOGGER = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+# App states accepted by the answer/hangup guards
+_INCOMING_CALL_STATES: Final = frozenset(
+    {AppState.INCOMING_CALL, AppState.INCOMING_CALL_RING}
+)
+_HANGUP_STATES: Final = _INCOMING_CALL_STATES | {
+    AppState.IN_CALL,
+    AppState.INVALID_NUMBER,
+    AppState.DIALING,
+}
+
+# Import failures logged at WARNING before the rest drop to DEBUG
+_IMPORT_WARNING_LIMIT: Final = 10
+
+# Service field name -> firmware audio config key
+_AUDIO_KEY_MAP: dict[str, str] = {
+    "earpiece_volume": "earpieceVolume",
+    "earpiece_gain": "earpieceGain",
+    "speaker_volume": "speakerVolume",
+    "speaker_gain": "speakerGain",
+}
+
 # Service schemas
 
 
@@ -102,9 +137,28 @@ def _validate_numeric_code(value: str) -> str:
     return value
 
 
+# Shared field markers and validators. Schemas keep ALLOW_EXTRA because
+# device/entity/area targets arrive in call.data alongside service fields.
+_REQUIRED_NUMBER = vol.Required("number")
+_REQUIRED_NAME = vol.Required("name")
+_REQUIRED_ID = vol.Required("id")
+_REQUIRED_CODE = vol.Required("code")
+_REQUIRED_URL = vol.Required("url")
+_NON_EMPTY_STRING = vol.All(cv.string, vol.Length(min=1))
+_NUMERIC_CODE = vol.All(cv.string, _validate_numeric_code)
+_AUDIO_LEVEL = vol.All(
+    vol.Coerce(int), vol.Range(min=AUDIO_MIN_LEVEL, max=AUDIO_MAX_LEVEL)
+)
+_HOUR = vol.All(vol.Coerce(int), vol.Range(min=0, max=23))
+_MINUTE = vol.All(vol.Coerce(int), vol.Range(min=0, max=59))
+_POSITIVE_INT = vol.All(vol.Coerce(int), vol.Range(min=1))
+_MAX_CONCURRENCY = vol.All(
+    vol.Coerce(int), vol.Range(min=1, max=SERVICE_MAX_CONCURRENCY)
+)
+
 DIAL_SCHEMA = _service_schema(
     {
-        vol.Required("number"): cv.string,
+        _REQUIRED_NUMBER: cv.string,
     }
 )
 
@@ -158,29 +212,16 @@ SET_DND_SCHEMA = _service_schema(
     {
         vol.Optional("force"): cv.boolean,
         vol.Optional("scheduled"): cv.boolean,
-        vol.Optional("start_hour"): vol.All(vol.Coerce(int), vol.Range(min=0, max=23)),
-        vol.Optional("start_minute"): vol.All(
-            vol.Coerce(int), vol.Range(min=0, max=59)
-        ),
-        vol.Optional("end_hour"): vol.All(vol.Coerce(int), vol.Range(min=0, max=23)),
-        vol.Optional("end_minute"): vol.All(vol.Coerce(int), vol.Range(min=0, max=59)),
+        vol.Optional("start_hour"): _HOUR,
+        vol.Optional("start_minute"): _MINUTE,
+        vol.Optional("end_hour"): _HOUR,
+        vol.Optional("end_minute"): _MINUTE,
     }
 )
 
 SET_AUDIO_SCHEMA = _service_schema(
     {
-        vol.Optional("earpiece_volume"): vol.All(
-            vol.Coerce(int), vol.Range(min=AUDIO_MIN_LEVEL, max=AUDIO_MAX_LEVEL)
-        ),
-        vol.Optional("earpiece_gain"): vol.All(
-            vol.Coerce(int), vol.Range(min=AUDIO_MIN_LEVEL, max=AUDIO_MAX_LEVEL)
-        ),
-        vol.Optional("speaker_volume"): vol.All(
-            vol.Coerce(int), vol.Range(min=AUDIO_MIN_LEVEL, max=AUDIO_MAX_LEVEL)
-        ),
-        vol.Optional("speaker_gain"): vol.All(
-            vol.Coerce(int), vol.Range(min=AUDIO_MIN_LEVEL, max=AUDIO_MAX_LEVEL)
-        ),
+        vol.Optional(service_key): _AUDIO_LEVEL for service_key in _AUDIO_KEY_MAP
     }
 )
 
@@ -198,16 +239,16 @@ CALL_HISTORY_SCHEMA = _service_schema(
 
 CALL_HISTORY_CLEAR_SCHEMA = _service_schema(
     {
-        vol.Optional("older_than_days"): vol.All(vol.Coerce(int), vol.Range(min=1)),
-        vol.Optional("keep_last"): vol.All(vol.Coerce(int), vol.Range(min=1)),
+        vol.Optional("older_than_days"): _POSITIVE_INT,
+        vol.Optional("keep_last"): _POSITIVE_INT,
     }
 )
 
 QUICK_DIAL_ADD_SCHEMA = _service_schema(
     {
-        vol.Optional("code"): vol.All(cv.string, _validate_numeric_code),
-        vol.Required("number"): cv.string,
-        vol.Required("name"): vol.All(cv.string, vol.Length(min=1)),
+        vol.Optional("code"): _NUMERIC_CODE,
+        _REQUIRED_NUMBER: cv.string,
+        _REQUIRED_NAME: _NON_EMPTY_STRING,
     }
 )
 
@@ -233,9 +274,9 @@ QUICK_DIAL_REMOVE_SCHEMA = vol.Schema(
 
 EDIT_CONTACT_SCHEMA = _service_schema(
     {
-        vol.Required("id"): cv.string,
-        vol.Required("name"): vol.All(cv.string, vol.Length(min=1)),
-        vol.Required("number"): cv.string,
+        _REQUIRED_ID: cv.string,
+        _REQUIRED_NAME: _NON_EMPTY_STRING,
+        _REQUIRED_NUMBER: cv.string,
         vol.Optional("code"): cv.string,
         vol.Optional("priority"): cv.boolean,
     }
@@ -243,47 +284,47 @@ EDIT_CONTACT_SCHEMA = _service_schema(
 
 BLOCKED_ADD_SCHEMA = _service_schema(
     {
-        vol.Required("number"): cv.string,
-        vol.Required("name"): vol.All(cv.string, vol.Length(min=1)),
+        _REQUIRED_NUMBER: cv.string,
+        _REQUIRED_NAME: _NON_EMPTY_STRING,
     }
 )
 
 BLOCKED_REMOVE_SCHEMA = _service_schema(
     {
-        vol.Required("id"): cv.string,
+        _REQUIRED_ID: cv.string,
     }
 )
 
 # Priority caller schemas
 PRIORITY_ADD_SCHEMA = _service_schema(
     {
-        vol.Required("number"): cv.string,
+        _REQUIRED_NUMBER: cv.string,
     }
 )
 
 PRIORITY_REMOVE_SCHEMA = _service_schema(
     {
-        vol.Required("number"): cv.string,
+        _REQUIRED_NUMBER: cv.string,
     }
 )
 
 WEBHOOK_ADD_SCHEMA = _service_schema(
     {
         vol.Required("webhook_id"): cv.string,
-        vol.Required("code"): vol.All(cv.string, _validate_numeric_code),
+        _REQUIRED_CODE: _NUMERIC_CODE,
         vol.Optional("name"): cv.string,
     }
 )
 
 WEBHOOK_REMOVE_SCHEMA = _service_schema(
     {
-        vol.Required("code"): vol.All(cv.string, _validate_numeric_code),
+        _REQUIRED_CODE: _NUMERIC_CODE,
     }
 )
 
 WEBHOOK_TEST_SCHEMA = _service_schema(
     {
-        vol.Required("url"): cv.string,
+        _REQUIRED_URL: cv.string,
     }
 )
 
@@ -297,43 +338,55 @@ DEVICE_ONLY_SCHEMA = _service_schema({})
 
 DIAL_QUICK_DIAL_SCHEMA = _service_schema(
     {
-        vol.Required("code"): vol.All(cv.string, _validate_numeric_code),
+        _REQUIRED_CODE: _NUMERIC_CODE,
     }
 )
 
 SET_HA_URL_SCHEMA = _service_schema(
     {
-        vol.Required("url"): cv.string,
+        _REQUIRED_URL: cv.string,
     }
 )
 
 # Phase P4: Bulk import/export schemas
+# Entry schemas drop unknown keys (e.g. extra spreadsheet columns) instead of
+# rejecting the whole import
+QUICK_DIAL_IMPORT_ENTRY_SCHEMA = vol.Schema(
+    {
+        _REQUIRED_CODE: cv.string,
+        _REQUIRED_NUMBER: cv.string,
+        vol.Optional("name"): cv.string,
+    },
+    extra=vol.REMOVE_EXTRA,
+)
+
+BLOCKED_IMPORT_ENTRY_SCHEMA = vol.Schema(
+    {
+        _REQUIRED_NUMBER: cv.string,
+        vol.Optional("name"): cv.string,
+    },
+    extra=vol.REMOVE_EXTRA,
+)
+
 QUICK_DIAL_IMPORT_SCHEMA = _service_schema(
     {
-        vol.Required("entries"): [
-            vol.Schema(
-                {
-                    vol.Required("code"): cv.string,
-                    vol.Required("number"): cv.string,
-                    vol.Optional("name"): cv.string,
-                }
-            )
-        ],
+        vol.Required("entries"): [QUICK_DIAL_IMPORT_ENTRY_SCHEMA],
         vol.Optional("clear_existing", default=False): cv.boolean,
+        vol.Optional(
+            "max_concurrency", default=SERVICE_CONCURRENCY_LIMIT
+        ): _MAX_CONCURRENCY,
+        vol.Optional("verbose", default=False): cv.boolean,
     }
 )
 
 BLOCKED_IMPORT_SCHEMA = _service_schema(
     {
-        vol.Required("entries"): [
-            vol.Schema(
-                {
-                    vol.Required("number"): cv.string,
-                    vol.Optional("name"): cv.string,
-                }
-            )
-        ],
+        vol.Required("entries"): [BLOCKED_IMPORT_ENTRY_SCHEMA],
         vol.Optional("clear_existing", default=False): cv.boolean,
+        vol.Optional(
+            "max_concurrency", default=SERVICE_CONCURRENCY_LIMIT
+        ): _MAX_CONCURRENCY,
+        vol.Optional("verbose", default=False): cv.boolean,
     }
 )
 
@@ -347,6 +400,263 @@ RESILIENCE_TEST_SCHEMA = _service_schema(
 )
 
 
+def _history_serializer(
+    *fields: str,
+) -> Callable[[CallHistoryEntry], dict[str, Any]]:
+    """Build a serializer emitting the given call history fields.
+
+    Fields are fetched with a single attrgetter call; ``timestamp`` must be
+    included and is rendered as an ISO string.
+    """
+
+    getter = operator.attrgetter(*fields)
+
+    def _serialize(entry: CallHistoryEntry) -> dict[str, Any]:
+        data = dict(zip(fields, getter(entry), strict=True))
+        timestamp = data["timestamp"]
+        data["timestamp"] = timestamp.isoformat() if timestamp else None
+        return data
+
+    return _serialize
+
+
+_call_history_entry_to_dict = _history_serializer(
+    "number",
+    "call_type",
+    "timestamp",
+    "is_incoming",
+    "duration_s",
+    "ts_device",
+    "received_ts",
+    "seq",
+    "synthetic",
+    "reason",
+)
+
+_missed_call_entry_to_dict = _history_serializer(
+    "number",
+    "timestamp",
+    "call_type",
+    "ts_device",
+    "received_ts",
+)
+
+
+def _serialize_all(
+    serializer: Callable[[CallHistoryEntry], dict[str, Any]],
+    entries: list[CallHistoryEntry],
+) -> list[dict[str, Any]]:
+    """Serialize a batch of call history entries."""
+    return [serializer(entry) for entry in entries]
+
+
+async def _async_serialize_history(
+    hass: HomeAssistant,
+    serializer: Callable[[CallHistoryEntry], dict[str, Any]],
+    entries: list[CallHistoryEntry],
+) -> list[dict[str, Any]]:
+    """Serialize call history entries, moving large batches off the event loop.
+
+    ``entries`` must be a snapshot the coordinator will not mutate meanwhile.
+    """
+    if len(entries) > SERVICE_EXECUTOR_THRESHOLD:
+        return await hass.async_add_executor_job(_serialize_all, serializer, entries)
+    return _serialize_all(serializer, entries)
+
+
+async def _gather_bounded(
+    items: Iterable[_T],
+    worker: Callable[[_T], Awaitable[_R]],
+    limit: int = SERVICE_CONCURRENCY_LIMIT,
+) -> list[_R]:
+    """Run ``worker`` over ``items`` concurrently with at most ``limit`` in flight.
+
+    Results are returned in input order.
+    """
+
+    semaphore = asyncio.Semaphore(limit)
+
+    async def _run(item: _T) -> _R:
+        async with semaphore:
+            return await worker(item)
+
+    return await asyncio.gather(*(_run(item) for item in items))
+
+
+def _import_log_level(results: dict[str, Any]) -> int:
+    """Log level for an import failure; demoted once a failing import gets noisy."""
+    if len(results["failed"]) > _IMPORT_WARNING_LIMIT:
+        return logging.DEBUG
+    return logging.WARNING
+
+
+async def _async_import_chunks(
+    coordinator: TsuryPhoneDataUpdateCoordinator,
+    label: str,
+    id_field: str,
+    pending: list[dict[str, str]],
+    bulk_add: Callable[[list[dict[str, str]], bool], Awaitable[dict[str, Any]]],
+    add_one: Callable[[dict[str, str]], Awaitable[Any]],
+    clear: Callable[[], Awaitable[Any]],
+    clear_existing: bool,
+    max_concurrency: int,
+    results: dict[str, Any],
+) -> None:
+    """Send validated import entries to the device in fixed-size chunks.
+
+    Each chunk goes through the bulk endpoint; the first one also carries the
+    clear flag. Firmware without bulk support gets a separate clear followed
+    by bounded per-entry adds. Outcomes are collected into ``results``.
+    Device calls go through the coordinator's ``api_caller`` so transient
+    failures are retried.
+
+    A bulk chunk that fails is recorded against its entries so earlier
+    chunks keep their results; the error is only raised when nothing has
+    reached the device yet.
+    """
+    caller = coordinator.api_caller
+
+    async def _add(entry: dict[str, str]) -> TsuryPhoneAPIError | None:
+        try:
+            await caller.call(add_one, entry)
+        except TsuryPhoneAPIError as err:
+            return err
+        return None
+
+    added_append = results["added"].append
+    failed_append = results["failed"].append
+    chunks = [
+        pending[start : start + IMPORT_CHUNK_SIZE]
+        for start in range(0, len(pending), IMPORT_CHUNK_SIZE)
+    ] or ([[]] if clear_existing else [])
+    use_bulk = True
+    applied = False
+
+    for index, chunk in enumerate(chunks, 1):
+        if use_bulk:
+            clear_chunk = clear_existing and index == 1
+            try:
+                # A timed-out bulk POST may already have been applied, so
+                # only replay it when the device explicitly failed it
+                response = await caller.call(
+                    bulk_add,
+                    chunk,
+                    clear_chunk,
+                    retry_if=coordinator.api_client.is_server_error,
+                )
+            except TsuryPhoneAPIError as err:
+                if not coordinator.api_client.is_unsupported_endpoint(err):
+                    if not applied:
+                        raise
+                    for entry in chunk:
+                        failed_append({id_field: entry[id_field], "error": str(err)})
+                    _LOGGER.warning(
+                        "Failed to import %s chunk %d/%d: %s",
+                        label,
+                        index,
+                        len(chunks),
+                        err,
+                    )
+                    continue
+                _LOGGER.debug(
+                    "Bulk endpoint for %s unavailable, adding entries individually",
+                    label,
+                )
+                use_bulk = False
+                if clear_chunk:
+                    await clear()
+                    results["cleared"] = True
+                    applied = True
+                    _LOGGER.info("Cleared existing %s", label)
+            else:
+                applied = True
+                if clear_chunk:
+                    results["cleared"] = True
+                results["added"].extend(response.get("added", ()))
+                results["failed"].extend(response.get("failed", ()))
+
+        if not use_bulk:
+            errors = await _gather_bounded(chunk, _add, max_concurrency)
+            for entry, error in zip(chunk, errors, strict=True):
+                if error is None:
+                    applied = True
+                    added_append(entry[id_field])
+                    continue
+                failed_append({id_field: entry[id_field], "error": str(error)})
+                _LOGGER.log(
+                    _import_log_level(results),
+                    "Failed to import %s %s: %s",
+                    label,
+                    entry[id_field],
+                    error,
+                )
+
+        if chunk:
+            _LOGGER.info(
+                "Imported %s chunk %d/%d (%d entries)",
+                label,
+                index,
+                len(chunks),
+                len(chunk),
+            )
+
+
+@callback
+def _async_finish_import(
+    coordinator: TsuryPhoneDataUpdateCoordinator,
+    kind: str,
+    results: dict[str, Any],
+) -> None:
+    """Summarize a finished import and schedule a refresh if the device changed.
+
+    The refresh runs in the background so callers get their results at once.
+    """
+    added = len(results["added"])
+    skipped = len(results["skipped"])
+    failed = len(results["failed"])
+    cleared = results["cleared"]
+
+    _LOGGER.info(
+        "%s import: %d added, %d unchanged, %d failed, cleared=%s",
+        kind,
+        added,
+        skipped,
+        failed,
+        cleared,
+    )
+    coordinator.hass.bus.async_fire(
+        HA_EVENT_BULK_IMPORT_COMPLETE,
+        {
+            "device_id": coordinator.device_info.device_id,
+            "kind": kind,
+            "added": added,
+            "skipped": skipped,
+            "failed": failed,
+            "cleared": cleared,
+        },
+    )
+
+    if added or cleared:
+        coordinator.async_schedule_refresh_debounced()
+
+
+def _import_response(results: dict[str, Any], verbose: bool) -> dict[str, Any]:
+    """Shape import results for the service response.
+
+    Unless ``verbose`` is set, successful entries are reported as a count only.
+    """
+    if verbose:
+        return results
+    return {
+        # Entries already on the device count as imported
+        "added_count": len(results["added"]) + len(results["skipped"]),
+        "skipped_count": len(results["skipped"]),
+        "failed_count": len(results["failed"]),
+        "failed": results["failed"],
+        "cleared": results["cleared"],
+    }
+
+
 # Target resolution helpers
 
 
@@ -411,6 +721,52 @@ class ServiceDeviceContext:
         return self.coordinator.device_info.device_id
 
 
+def _coordinators_by_device(
+    hass: HomeAssistant,
+) -> dict[str, TsuryPhoneDataUpdateCoordinator]:
+    """Return the device-id to coordinator cache kept in hass.data."""
+
+    return hass.data.setdefault(DOMAIN, {}).setdefault(DATA_COORDINATORS_BY_DEVICE, {})
+
+
+def _lookup_device_coordinator(
+    hass: HomeAssistant,
+    device_registry: dr.DeviceRegistry,
+    hass_device_id: str,
+) -> TsuryPhoneDataUpdateCoordinator:
+    """Find the coordinator for a device through its config entries."""
+
+    device_entry = device_registry.async_get(hass_device_id)
+    if not device_entry:
+        raise ServiceValidationError(f"Device {hass_device_id} not found")
+
+    for entry_id in device_entry.config_entries:
+        config_entry = hass.config_entries.async_get_entry(entry_id)
+        if config_entry and config_entry.domain == DOMAIN:
+            runtime = getattr(config_entry, "runtime_data", None)
+            if isinstance(runtime, TsuryPhoneDataUpdateCoordinator):
+                return runtime
+
+    raise ServiceValidationError(
+        f"Device {hass_device_id} is not associated with an active TsuryPhone integration"
+    )
+
+
+@callback
+def async_forget_coordinator(
+    hass: HomeAssistant, coordinator: TsuryPhoneDataUpdateCoordinator
+) -> None:
+    """Drop cached device lookups pointing at an unloaded coordinator."""
+
+    coordinators = _coordinators_by_device(hass)
+    for hass_device_id in [
+        device_id
+        for device_id, cached in coordinators.items()
+        if cached is coordinator
+    ]:
+        del coordinators[hass_device_id]
+
+
 def _resolve_target_device_contexts(call: ServiceCall) -> list[ServiceDeviceContext]:
     """Resolve targeted devices for a service call."""
 
@@ -481,25 +837,15 @@ def _resolve_target_device_contexts(call: ServiceCall) -> list[ServiceDeviceCont
             f"Service '{call.service}' requires targeting at least one TsuryPhone device."
         )
 
+    coordinators = _coordinators_by_device(hass)
     contexts: list[ServiceDeviceContext] = []
     for hass_device_id in device_ids:
-        device_entry = device_registry.async_get(hass_device_id)
-        if not device_entry:
-            raise ServiceValidationError(f"Device {hass_device_id} not found")
-
-        coordinator: TsuryPhoneDataUpdateCoordinator | None = None
-        for entry_id in device_entry.config_entries:
-            config_entry = hass.config_entries.async_get_entry(entry_id)
-            if config_entry and config_entry.domain == DOMAIN:
-                runtime = getattr(config_entry, "runtime_data", None)
-                if isinstance(runtime, TsuryPhoneDataUpdateCoordinator):
-                    coordinator = runtime
-                    break
-
+        coordinator = coordinators.get(hass_device_id)
         if coordinator is None:
-            raise ServiceValidationError(
-                f"Device {hass_device_id} is not associated with an active TsuryPhone integration"
+            coordinator = _lookup_device_coordinator(
+                hass, device_registry, hass_device_id
             )
+            coordinators[hass_device_id] = coordinator
 
         contexts.append(
             ServiceDeviceContext(
@@ -523,8 +869,31 @@ def _require_single_device_context(call: ServiceCall) -> ServiceDeviceContext:
     return contexts[0]
 
 
+def _simple_device_service(
+    method_name: str, fields: tuple[str, ...], error: str
+) -> Callable[[ServiceCall], Awaitable[None]]:
+    """Build a handler passing call fields to a single API client method.
+
+    ``error`` is formatted with the declared fields and the API error as
+    ``err``.
+    """
+
+    async def _handler(call: ServiceCall) -> None:
+        coordinator = _require_single_device_context(call).coordinator
+        values = {field: call.data[field] for field in fields}
+        try:
+            await getattr(coordinator.api_client, method_name)(*values.values())
+        except TsuryPhoneAPIError as err:
+            raise HomeAssistantError(error.format(err=err, **values)) from err
+
+    return _handler
+
+
 # Phase P8: Resilience and monitoring services
 
+_API_CONNECTIVITY_PASS: Final = {"test": "api_connectivity", "status": "pass"}
+_API_CONNECTIVITY_FAIL: Final = {"test": "api_connectivity", "status": "fail"}
+
 
 async def async_resilience_status(call: ServiceCall) -> ServiceResponse:
     """Get resilience status for the device."""
@@ -552,18 +921,17 @@ async def async_resilience_test(call: ServiceCall) -> ServiceResponse:
     if not coordinator._resilience:
         raise ServiceValidationError("Resilience manager not available")
 
+    now = time.time()
     test_results = {"test_type": test_type, "results": []}
 
     if test_type == "connection":
         # Test API connectivity
         try:
             await coordinator.api_client.get_tsuryphone_config()
-            test_results["results"].append(
-                {"test": "api_connectivity", "status": "pass"}
-            )
+            test_results["results"].append(dict(_API_CONNECTIVITY_PASS))
         except Exception as err:
             test_results["results"].append(
-                {"test": "api_connectivity", "status": "fail", "error": str(err)}
+                {**_API_CONNECTIVITY_FAIL, "error": str(err)}
             )
 
         # Test WebSocket connectivity
@@ -582,15 +950,13 @@ async def async_resilience_test(call: ServiceCall) -> ServiceResponse:
         test_event_data = {
             "schemaVersion": INTEGRATION_EVENT_SCHEMA_VERSION,
             "seq": coordinator.data.last_seq + 1,
-            "ts": int(time.time() * 1000),
+            "ts": int(now * 1000),
             "integration": "ha",
             "deviceId": device_id,
             "category": "system",
             "event": "test_event",
         }
 
-        from .models import TsuryPhoneEvent
-
         test_event = TsuryPhoneEvent.from_json(test_event_data)
 
         should_process = await coordinator._resilience.handle_event_sequence(test_event)
@@ -605,10 +971,19 @@ async def async_resilience_test(call: ServiceCall) -> ServiceResponse:
     return {
         "device_id": device_id,
         "test_results": test_results,
-        "timestamp": time.time(),
+        "timestamp": now,
     }
 
 
+@callback
+def _log_reconnect_result(task: asyncio.Task[Any]) -> None:
+    """Log the outcome of a reconnect that outlived the service call."""
+    if task.cancelled():
+        return
+    if (err := task.exception()) is not None:
+        _LOGGER.error("WebSocket reconnection failed: %s", err)
+
+
 async def async_websocket_reconnect(call: ServiceCall) -> ServiceResponse:
     """Force WebSocket reconnection."""
     context = _require_single_device_context(call)
@@ -620,14 +995,31 @@ async def async_websocket_reconnect(call: ServiceCall) -> ServiceResponse:
 
     _LOGGER.info("Forcing WebSocket reconnection for device %s", device_id)
 
-    try:
-        await coordinator._websocket_client.reconnect()
-        status = "success"
-        message = "WebSocket reconnection initiated"
-    except Exception as err:
+    # Bound how long the caller waits; a slow close keeps running in the
+    # background and its outcome is reported through connection state events.
+    reconnect_task = call.hass.async_create_background_task(
+        coordinator._websocket_client.reconnect(),
+        name=f"{DOMAIN}_websocket_reconnect_{device_id}",
+    )
+    done, _ = await asyncio.wait(
+        {reconnect_task}, timeout=WEBSOCKET_RECONNECT_SERVICE_TIMEOUT
+    )
+
+    if not done:
+        status = "initiated"
+        message = "WebSocket reconnection in progress"
+        reconnect_task.add_done_callback(_log_reconnect_result)
+    elif reconnect_task.cancelled():
+        status = "error"
+        message = "WebSocket reconnection was cancelled"
+        _LOGGER.warning("WebSocket reconnection for device %s cancelled", device_id)
+    elif (err := reconnect_task.exception()) is not None:
         status = "error"
         message = f"Failed to reconnect: {err}"
         _LOGGER.error("WebSocket reconnection failed: %s", err)
+    else:
+        status = "success"
+        message = "WebSocket reconnected"
 
     return {
         "device_id": device_id,
@@ -655,955 +1047,962 @@ async def async_run_health_check(call: ServiceCall) -> ServiceResponse:
     }
 
 
-async def async_setup_services(hass: HomeAssistant) -> None:
-    """Set up services for TsuryPhone integration."""
+async def async_dial(call: ServiceCall) -> None:
+    context = _require_single_device_context(call)
+    coordinator = context.coordinator
+    number = _normalize_number_for_service(
+        coordinator, call.data["number"], field_name="number"
+    )
 
-    async def async_dial(call: ServiceCall) -> None:
-        context = _require_single_device_context(call)
-        coordinator = context.coordinator
-        number = _normalize_number_for_service(
-            coordinator, call.data["number"], field_name="number"
-        )
+    try:
+        await coordinator.api_client.dial(number)
+    except TsuryPhoneAPIError as err:
+        raise HomeAssistantError(f"Failed to dial {number}: {err}") from err
 
-        try:
-            await coordinator.api_client.dial(number)
-        except TsuryPhoneAPIError as err:
-            raise HomeAssistantError(f"Failed to dial {number}: {err}") from err
 
-    async def async_dial_digit(call: ServiceCall) -> None:
-        # Debug: Always log the send mode state FIRST
-        _LOGGER.debug("========== DIAL_DIGIT SERVICE CALLED ==========")
+async def async_dial_digit(call: ServiceCall) -> None:
+    # Debug: Always log the send mode state FIRST
+    _LOGGER.debug("========== DIAL_DIGIT SERVICE CALLED ==========")
+
+    context = _require_single_device_context(call)
+    coordinator = context.coordinator
+    digit = call.data["digit"]
 
-        context = _require_single_device_context(call)
-        coordinator = context.coordinator
-        digit = call.data["digit"]
+    # Check if send mode is enabled - if so, defer validation
+    defer_validation = coordinator.send_mode_enabled
 
-        # Check if send mode is enabled - if so, defer validation
-        defer_validation = coordinator.send_mode_enabled
+    # Debug: Always log the send mode state
+    _LOGGER.debug(
+        "dial_digit: digit=%s | coordinator.send_mode_enabled=%s | defer_validation=%s",
+        digit,
+        coordinator.send_mode_enabled,
+        defer_validation,
+    )
 
-        # Debug: Always log the send mode state
-        _LOGGER.debug(
-            "dial_digit: digit=%s | coordinator.send_mode_enabled=%s | defer_validation=%s",
-            digit,
-            coordinator.send_mode_enabled,
-            defer_validation,
+    try:
+        await coordinator.api_client.dial_digit(
+            digit, defer_validation=defer_validation
         )
+    except TsuryPhoneAPIError as err:
+        raise HomeAssistantError(f"Failed to send digit {digit}: {err}") from err
 
-        try:
-            await coordinator.api_client.dial_digit(
-                digit, defer_validation=defer_validation
-            )
-        except TsuryPhoneAPIError as err:
-            raise HomeAssistantError(f"Failed to send digit {digit}: {err}") from err
 
-    async def async_delete_last_digit(call: ServiceCall) -> None:
-        context = _require_single_device_context(call)
-        coordinator = context.coordinator
+async def async_delete_last_digit(call: ServiceCall) -> None:
+    context = _require_single_device_context(call)
+    coordinator = context.coordinator
 
-        if not coordinator.data.current_dialing_number:
-            raise ServiceValidationError("No digits to delete")
+    if not coordinator.data.current_dialing_number:
+        raise ServiceValidationError("No digits to delete")
 
-        try:
-            await coordinator.api_client.delete_last_digit()
-        except TsuryPhoneAPIError as err:
-            raise HomeAssistantError(f"Failed to delete last digit: {err}") from err
+    try:
+        await coordinator.api_client.delete_last_digit()
+    except TsuryPhoneAPIError as err:
+        raise HomeAssistantError(f"Failed to delete last digit: {err}") from err
 
-    async def async_send_dtmf(call: ServiceCall) -> None:
-        """Send DTMF digit during active call."""
-        context = _require_single_device_context(call)
-        coordinator = context.coordinator
-        digit = call.data["digit"]
 
-        # Ensure we're in an active call
-        if not coordinator.data.is_call_active:
-            raise ServiceValidationError(
-                "Cannot send DTMF: no active call in progress"
-            )
+async def async_send_dtmf(call: ServiceCall) -> None:
+    """Send DTMF digit during active call."""
+    context = _require_single_device_context(call)
+    coordinator = context.coordinator
+    digit = call.data["digit"]
 
-        try:
-            await coordinator.send_dtmf_digit(digit)
-        except TsuryPhoneAPIError as err:
-            raise HomeAssistantError(f"Failed to send DTMF digit {digit}: {err}") from err
+    # Ensure we're in an active call
+    if not coordinator.data.is_call_active:
+        raise ServiceValidationError(
+            "Cannot send DTMF: no active call in progress"
+        )
 
-    async def async_answer(call: ServiceCall) -> None:
-        context = _require_single_device_context(call)
-        coordinator = context.coordinator
+    try:
+        await coordinator.send_dtmf_digit(digit)
+    except TsuryPhoneAPIError as err:
+        raise HomeAssistantError(f"Failed to send DTMF digit {digit}: {err}") from err
 
-        if not coordinator.data.is_incoming_call:
-            raise ServiceValidationError("No incoming call to answer")
 
-        try:
-            await coordinator.api_client.answer_call()
-        except TsuryPhoneAPIError as err:
-            raise HomeAssistantError(f"Failed to answer call: {err}") from err
-
-    async def async_hangup(call: ServiceCall) -> None:
-        context = _require_single_device_context(call)
-        coordinator = context.coordinator
-
-        # Allow hangup when:
-        # 1. There's an active call
-        # 2. There's an incoming call (to decline it)
-        # 3. Currently dialing
-        # 4. In invalid number state
-        # 5. In idle state with dialed digits (to clear them)
-        has_dialed_digits = bool(coordinator.data.current_dialing_number)
-        
-        if (
-            not coordinator.data.is_call_active
-            and not coordinator.data.is_incoming_call
-            and coordinator.data.app_state != AppState.INVALID_NUMBER
-            and coordinator.data.app_state != AppState.DIALING
-            and not (coordinator.data.app_state == AppState.IDLE and has_dialed_digits)
-        ):
-            raise ServiceValidationError("No active call to hang up")
+async def async_answer(call: ServiceCall) -> None:
+    context = _require_single_device_context(call)
+    coordinator = context.coordinator
 
-        try:
-            await coordinator.api_client.hangup_call()
-        except TsuryPhoneAPIError as err:
-            raise HomeAssistantError(f"Failed to hang up call: {err}") from err
+    if coordinator.data.app_state not in _INCOMING_CALL_STATES:
+        raise ServiceValidationError("No incoming call to answer")
 
-    async def async_ring_device(call: ServiceCall) -> None:
-        context = _require_single_device_context(call)
-        coordinator = context.coordinator
-        pattern = call.data.get("pattern", "")
-        force_bypass = call.data.get("force")
+    try:
+        await coordinator.api_client.answer_call()
+    except TsuryPhoneAPIError as err:
+        raise HomeAssistantError(f"Failed to answer call: {err}") from err
 
-        try:
-            if force_bypass is None:
-                await coordinator.api_client.ring_device(pattern)
-            else:
-                await coordinator.api_client.ring_device(pattern, force=force_bypass)
-        except TsuryPhoneAPIError as err:
-            raise HomeAssistantError(f"Failed to ring device: {err}") from err
 
-    async def async_stop_ringing(call: ServiceCall) -> None:
-        context = _require_single_device_context(call)
-        coordinator = context.coordinator
+async def async_hangup(call: ServiceCall) -> None:
+    context = _require_single_device_context(call)
+    coordinator = context.coordinator
 
-        try:
-            await coordinator.api_client.stop_ringing()
-        except TsuryPhoneAPIError as err:
-            raise HomeAssistantError(f"Failed to stop ringing: {err}") from err
+    # Allow hangup when:
+    # 1. There's an active call
+    # 2. There's an incoming call (to decline it)
+    # 3. Currently dialing
+    # 4. In invalid number state
+    # 5. In idle state with dialed digits (to clear them)
+    state = coordinator.data
+    app_state = state.app_state
+
+    if app_state not in _HANGUP_STATES and not (
+        app_state == AppState.IDLE and state.current_dialing_number
+    ):
+        raise ServiceValidationError("No active call to hang up")
 
-    async def async_set_ring_pattern(call: ServiceCall) -> None:
-        context = _require_single_device_context(call)
-        coordinator = context.coordinator
-        pattern = call.data["pattern"]
+    try:
+        await coordinator.api_client.hangup_call()
+    except TsuryPhoneAPIError as err:
+        raise HomeAssistantError(f"Failed to hang up call: {err}") from err
 
-        try:
-            await coordinator.api_client.set_ring_pattern(pattern)
-            await coordinator.async_request_refresh()
-        except TsuryPhoneAPIError as err:
-            raise HomeAssistantError(f"Failed to set ring pattern: {err}") from err
 
-    async def async_reset_device(call: ServiceCall) -> None:
-        context = _require_single_device_context(call)
-        coordinator = context.coordinator
+async def async_ring_device(call: ServiceCall) -> None:
+    context = _require_single_device_context(call)
+    coordinator = context.coordinator
+    pattern = call.data.get("pattern", "")
+    force_bypass = call.data.get("force")
 
-        try:
-            await coordinator.api_client.reset_device()
-        except TsuryPhoneAPIError as err:
-            raise HomeAssistantError(f"Failed to reset device: {err}") from err
+    try:
+        if force_bypass is None:
+            await coordinator.api_client.ring_device(pattern)
+        else:
+            await coordinator.api_client.ring_device(pattern, force=force_bypass)
+    except TsuryPhoneAPIError as err:
+        raise HomeAssistantError(f"Failed to ring device: {err}") from err
 
-    async def async_factory_reset_device(call: ServiceCall) -> None:
-        context = _require_single_device_context(call)
-        coordinator = context.coordinator
 
-        try:
-            await coordinator.api_client.factory_reset_device()
-        except TsuryPhoneAPIError as err:
-            raise HomeAssistantError(f"Failed to factory reset device: {err}") from err
-
-    async def async_set_dnd(call: ServiceCall) -> None:
-        context = _require_single_device_context(call)
-        coordinator = context.coordinator
-
-        dnd_config: dict[str, Any] = {}
-        field_mapping = {
-            "force": "force",
-            "scheduled": "scheduled",
-            "start_hour": "startHour",
-            "start_minute": "startMinute",
-            "end_hour": "endHour",
-            "end_minute": "endMinute",
-        }
-        for service_key, api_key in field_mapping.items():
-            if service_key in call.data:
-                dnd_config[api_key] = call.data[service_key]
+async_stop_ringing = _simple_device_service(
+    "stop_ringing", (), "Failed to stop ringing: {err}"
+)
 
-        try:
-            await coordinator.api_client.set_dnd(dnd_config)
-            await coordinator.async_request_refresh()
-        except TsuryPhoneAPIError as err:
-            raise HomeAssistantError(f"Failed to set DND: {err}") from err
-
-    async def async_set_audio(call: ServiceCall) -> None:
-        context = _require_single_device_context(call)
-        coordinator = context.coordinator
-
-        audio_config: dict[str, Any] = {}
-        for key in [
-            "earpiece_volume",
-            "earpiece_gain",
-            "speaker_volume",
-            "speaker_gain",
-        ]:
-            if key in call.data:
-                api_key = (
-                    key.replace("_", "")
-                    .replace("earpiece", "earpiece")
-                    .replace("speaker", "speaker")
-                )
-                if api_key.startswith("earpiece"):
-                    api_key = "earpieceVolume" if "volume" in key else "earpieceGain"
-                elif api_key.startswith("speaker"):
-                    api_key = "speakerVolume" if "volume" in key else "speakerGain"
-                audio_config[api_key] = call.data[key]
 
-        try:
-            await coordinator.api_client.set_audio_config(audio_config)
-            await coordinator.async_request_refresh()
-        except TsuryPhoneAPIError as err:
-            raise HomeAssistantError(f"Failed to set audio config: {err}") from err
+async def async_set_ring_pattern(call: ServiceCall) -> None:
+    context = _require_single_device_context(call)
+    coordinator = context.coordinator
+    pattern = call.data["pattern"]
+
+    try:
+        await coordinator.api_client.set_ring_pattern(pattern)
+        coordinator.async_apply_local_config({"ring.pattern": pattern})
+    except TsuryPhoneAPIError as err:
+        raise HomeAssistantError(f"Failed to set ring pattern: {err}") from err
 
-    async def async_set_dialing_config(call: ServiceCall) -> None:
-        context = _require_single_device_context(call)
-        coordinator = context.coordinator
-        raw_code = call.data["default_code"]
-        sanitized_code = sanitize_default_dialing_code(raw_code)
 
-        if not sanitized_code:
-            raise ServiceValidationError("default_code must contain at least one digit")
+async_reset_device = _simple_device_service(
+    "reset_device", (), "Failed to reset device: {err}"
+)
 
-        try:
-            await coordinator.api_client.set_dialing_config(sanitized_code)
-            await coordinator.async_request_refresh()
-        except TsuryPhoneAPIError as err:
-            raise HomeAssistantError(
-                f"Failed to set default dialing code: {err}"
-            ) from err
 
-    async def async_get_call_history(call: ServiceCall) -> dict[str, Any]:
-        context = _require_single_device_context(call)
-        coordinator = context.coordinator
-        limit = call.data.get("limit")
+async_factory_reset_device = _simple_device_service(
+    "factory_reset_device", (), "Failed to factory reset device: {err}"
+)
 
-        history = coordinator.data.call_history or []
-        if limit and len(history) > limit:
-            history = history[-limit:]
 
-        return {
-            "call_history": [
-                {
-                    "number": entry.number,
-                    "call_type": entry.call_type,
-                    "timestamp": (
-                        entry.timestamp.isoformat() if entry.timestamp else None
-                    ),
-                    "is_incoming": entry.is_incoming,
-                    "duration_s": entry.duration_s,
-                    "ts_device": entry.ts_device,
-                    "received_ts": entry.received_ts,
-                    "seq": entry.seq,
-                    "synthetic": entry.synthetic,
-                    "reason": entry.reason,
-                }
-                for entry in history
-            ]
-        }
+async def async_set_dnd(call: ServiceCall) -> None:
+    context = _require_single_device_context(call)
+    coordinator = context.coordinator
 
-    async def async_clear_call_history(call: ServiceCall) -> None:
-        context = _require_single_device_context(call)
-        coordinator = context.coordinator
-        older_than_days = call.data.get("older_than_days")
-        keep_last = call.data.get("keep_last")
-
-        if older_than_days or keep_last:
-            now = time.time()
-
-            if older_than_days:
-                cutoff = now - (older_than_days * 24 * 60 * 60)
-                coordinator.data.call_history = [
-                    entry
-                    for entry in coordinator.data.call_history
-                    if entry.received_ts > cutoff
-                ]
-
-            if keep_last and len(coordinator.data.call_history) > keep_last:
-                coordinator.data.call_history = coordinator.data.call_history[
-                    -keep_last:
-                ]
-        else:
-            coordinator.data.call_history = []
+    dnd_config: dict[str, Any] = {}
+    field_mapping = {
+        "force": "force",
+        "scheduled": "scheduled",
+        "start_hour": "startHour",
+        "start_minute": "startMinute",
+        "end_hour": "endHour",
+        "end_minute": "endMinute",
+    }
+    for service_key, api_key in field_mapping.items():
+        if service_key in call.data:
+            dnd_config[api_key] = call.data[service_key]
 
-        if coordinator._storage_cache:
-            await coordinator._storage_cache.async_save_call_history(
-                coordinator.data.call_history
-            )
+    try:
+        await coordinator.api_client.set_dnd(dnd_config)
+        coordinator.async_apply_local_config(
+            {f"dnd.{api_key}": value for api_key, value in dnd_config.items()}
+        )
+        # dnd_active is derived on the device, so re-read it after the write
+        await coordinator.async_request_refresh_debounced()
+    except TsuryPhoneAPIError as err:
+        raise HomeAssistantError(f"Failed to set DND: {err}") from err
 
-        coordinator.async_set_updated_data(coordinator.data)
 
-    async def async_quick_dial_add(call: ServiceCall) -> None:
-        context = _require_single_device_context(call)
-        coordinator = context.coordinator
-        code = call.data.get("code", "")  # Code is now optional
-        number = _normalize_number_for_service(
-            coordinator,
-            call.data["number"],
-            field_name="number",
-            remember=True,
+async def async_set_audio(call: ServiceCall) -> None:
+    context = _require_single_device_context(call)
+    coordinator = context.coordinator
+
+    audio_config: dict[str, Any] = {
+        api_key: call.data[service_key]
+        for service_key, api_key in _AUDIO_KEY_MAP.items()
+        if service_key in call.data
+    }
+
+    try:
+        await coordinator.api_client.set_audio_config(audio_config)
+        coordinator.async_apply_local_config(
+            {f"audio.{api_key}": value for api_key, value in audio_config.items()}
         )
-        name = call.data["name"].strip()
-        if not name:
-            raise ServiceValidationError("name cannot be empty")
-
-        _LOGGER.debug(
-            "quick_dial_add: code='%s' | number='%s' | name='%s'",
-            code,
-            number,
-            name,
+    except TsuryPhoneAPIError as err:
+        raise HomeAssistantError(f"Failed to set audio config: {err}") from err
+
+
+async def async_set_dialing_config(call: ServiceCall) -> None:
+    context = _require_single_device_context(call)
+    coordinator = context.coordinator
+    raw_code = call.data["default_code"]
+    sanitized_code = sanitize_default_dialing_code(raw_code)
+
+    if not sanitized_code:
+        raise ServiceValidationError("default_code must contain at least one digit")
+
+    try:
+        await coordinator.api_client.set_dialing_config(sanitized_code)
+        coordinator.async_apply_local_config({"dialing.defaultCode": sanitized_code})
+    except TsuryPhoneAPIError as err:
+        raise HomeAssistantError(
+            f"Failed to set default dialing code: {err}"
+        ) from err
+
+
+async def async_get_call_history(call: ServiceCall) -> dict[str, Any]:
+    context = _require_single_device_context(call)
+    coordinator = context.coordinator
+    limit = call.data.get("limit")
+
+    history = coordinator.data.call_history
+    history = history[-limit:] if limit else history[:]
+
+    return {
+        "call_history": await _async_serialize_history(
+            call.hass, _call_history_entry_to_dict, history
         )
+    }
 
-        try:
-            await coordinator.api_client.add_quick_dial(number, name, code)
-            await coordinator.async_request_refresh()
-        except TsuryPhoneAPIError as err:
-            raise HomeAssistantError(f"Failed to add quick dial: {err}") from err
 
-    async def async_quick_dial_remove(call: ServiceCall) -> None:
-        context = _require_single_device_context(call)
-        coordinator = context.coordinator
-        entry_id = call.data.get("id")
+async def async_clear_call_history(call: ServiceCall) -> None:
+    context = _require_single_device_context(call)
+    coordinator = context.coordinator
+    older_than_days = call.data.get("older_than_days")
+    keep_last = call.data.get("keep_last")
+
+    if older_than_days or keep_last:
+        history = coordinator.data.call_history
+
+        if older_than_days:
+            cutoff = time.time() - (older_than_days * 24 * 60 * 60)
+            # Entries are appended when a call ends, not when it was received,
+            # so history is not ordered by received_ts and must be filtered
+            history = [entry for entry in history if entry.received_ts > cutoff]
+
+        if keep_last and len(history) > keep_last:
+            history = history[-keep_last:]
+
+        if history is not coordinator.data.call_history:
+            coordinator.data.set_call_history(history)
+    else:
+        coordinator.data.set_call_history([])
+
+    coordinator._schedule_history_save()
+    coordinator.async_set_updated_data(coordinator.data)
+
+
+async def async_quick_dial_add(call: ServiceCall) -> None:
+    context = _require_single_device_context(call)
+    coordinator = context.coordinator
+    code = call.data.get("code", "")  # Code is now optional
+    number = _normalize_number_for_service(
+        coordinator,
+        call.data["number"],
+        field_name="number",
+        remember=True,
+    )
+    name = call.data["name"].strip()
+    if not name:
+        raise ServiceValidationError("name cannot be empty")
+
+    _LOGGER.debug(
+        "quick_dial_add: code='%s' | number='%s' | name='%s'",
+        code,
+        number,
+        name,
+    )
+
+    try:
+        await coordinator.api_client.add_quick_dial(number, name, code)
+        await coordinator.async_request_refresh_debounced()
+    except TsuryPhoneAPIError as err:
+        raise HomeAssistantError(f"Failed to add quick dial: {err}") from err
+
+
+async def async_quick_dial_remove(call: ServiceCall) -> None:
+    context = _require_single_device_context(call)
+    coordinator = context.coordinator
+    entry_id = call.data.get("id")
+
+    if not entry_id:
+        raise ServiceValidationError("'id' is required")
+
+    try:
+        await coordinator.api_client.remove_quick_dial_by_id(entry_id)
+        coordinator.async_apply_local_config({"quick_dial.remove": entry_id})
+    except TsuryPhoneAPIError as err:
+        raise HomeAssistantError(f"Failed to remove quick dial: {err}") from err
+
+
+async def async_edit_contact(call: ServiceCall) -> None:
+    context = _require_single_device_context(call)
+    coordinator = context.coordinator
+
+    entry_id = call.data.get("id")
+    if not entry_id:
+        raise ServiceValidationError("'id' is required")
+
+    name = call.data["name"].strip()
+    if not name:
+        raise ServiceValidationError("name cannot be empty")
+
+    number = _normalize_number_for_service(
+        coordinator,
+        call.data["number"],
+        field_name="number",
+        remember=True,
+    )
+
+    code = call.data.get("code", "")  # Optional
+    is_priority = call.data.get("priority", False)
+
+    _LOGGER.debug(
+        "edit_contact: id='%s' | name='%s' | number='%s' | code='%s' | priority=%s",
+        entry_id,
+        name,
+        number,
+        code,
+        is_priority,
+    )
+
+    try:
+        # Find the old contact to determine if priority changed
+        old_contact = None
+        for qd in coordinator.data.quick_dials:
+            if qd.id == entry_id:
+                old_contact = qd
+                break
+
+        if not old_contact:
+            raise ServiceValidationError(f"Contact with id '{entry_id}' not found")
+
+        # Check if contact was in priority list
+        old_priority_entry = None
+        for p in coordinator.data.priority_callers:
+            if p.number == old_contact.number:
+                old_priority_entry = p
+                break
+
+        was_priority = old_priority_entry is not None
+
+        # Remove old contact
+        await coordinator.api_client.remove_quick_dial_by_id(entry_id)
+
+        # Add new contact
+        await coordinator.api_client.add_quick_dial(number, name, code)
+
+        # Handle priority changes
+        if is_priority and not was_priority:
+            # Add to priority
+            await coordinator.api_client.add_priority_caller(number)
+        elif not is_priority and was_priority:
+            # Remove from priority using old entry ID
+            await coordinator.api_client.remove_priority_caller_by_id(old_priority_entry.id)
+        elif is_priority and was_priority and old_contact.number != number:
+            # Number changed but still priority - remove old, add new
+            await coordinator.api_client.remove_priority_caller_by_id(old_priority_entry.id)
+            await coordinator.api_client.add_priority_caller(number)
+
+        await coordinator.async_request_refresh_debounced()
+    except TsuryPhoneAPIError as err:
+        raise HomeAssistantError(f"Failed to edit contact: {err}") from err
 
-        if not entry_id:
-            raise ServiceValidationError("'id' is required")
 
+async def async_quick_dial_clear(call: ServiceCall) -> None:
+    context = _require_single_device_context(call)
+    coordinator = context.coordinator
+
+    errors: list[str] = []
+    for entry in list(coordinator.data.quick_dials):
         try:
-            await coordinator.api_client.remove_quick_dial_by_id(entry_id)
-            await coordinator.async_request_refresh()
+            await coordinator.api_client.remove_quick_dial_by_id(entry.id)
         except TsuryPhoneAPIError as err:
-            raise HomeAssistantError(f"Failed to remove quick dial: {err}") from err
-
-    async def async_edit_contact(call: ServiceCall) -> None:
-        context = _require_single_device_context(call)
-        coordinator = context.coordinator
-        
-        entry_id = call.data.get("id")
-        if not entry_id:
-            raise ServiceValidationError("'id' is required")
-        
-        name = call.data["name"].strip()
-        if not name:
-            raise ServiceValidationError("name cannot be empty")
-        
-        number = _normalize_number_for_service(
-            coordinator,
-            call.data["number"],
-            field_name="number",
-            remember=True,
-        )
-        
-        code = call.data.get("code", "")  # Optional
-        is_priority = call.data.get("priority", False)
-        
-        _LOGGER.debug(
-            "edit_contact: id='%s' | name='%s' | number='%s' | code='%s' | priority=%s",
-            entry_id,
-            name,
-            number,
-            code,
-            is_priority,
+            errors.append(f"Failed to remove {entry.id}: {err}")
+
+    await coordinator.async_request_refresh_debounced()
+
+    if errors:
+        raise HomeAssistantError(
+            f"Some entries failed to clear: {'; '.join(errors)}"
         )
 
+
+async def async_blocked_add(call: ServiceCall) -> None:
+    context = _require_single_device_context(call)
+    coordinator = context.coordinator
+    number = _normalize_number_for_service(
+        coordinator,
+        call.data["number"],
+        field_name="number",
+        remember=True,
+    )
+    name = call.data["name"].strip()
+    if not name:
+        raise ServiceValidationError("name cannot be empty")
+
+    try:
+        await coordinator.api_client.add_blocked_number(number, name)
+        await coordinator.async_request_refresh_debounced()
+    except TsuryPhoneAPIError as err:
+        raise HomeAssistantError(f"Failed to add blocked number: {err}") from err
+
+
+async def async_blocked_remove(call: ServiceCall) -> None:
+    context = _require_single_device_context(call)
+    coordinator = context.coordinator
+    entry_id = call.data.get("id")
+
+    if not entry_id:
+        raise ServiceValidationError("'id' is required")
+
+    try:
+        await coordinator.api_client.remove_blocked_number_by_id(entry_id)
+        coordinator.async_apply_local_config({"blocked.remove": entry_id})
+    except TsuryPhoneAPIError as err:
+        raise HomeAssistantError(f"Failed to remove blocked number: {err}") from err
+
+
+async def async_blocked_clear(call: ServiceCall) -> None:
+    context = _require_single_device_context(call)
+    coordinator = context.coordinator
+
+    errors: list[str] = []
+    for entry in list(coordinator.data.blocked_numbers):
         try:
-            # Find the old contact to determine if priority changed
-            old_contact = None
-            for qd in coordinator.data.quick_dials:
-                if qd.id == entry_id:
-                    old_contact = qd
-                    break
-            
-            if not old_contact:
-                raise ServiceValidationError(f"Contact with id '{entry_id}' not found")
-            
-            # Check if contact was in priority list
-            old_priority_entry = None
-            for p in coordinator.data.priority_callers:
-                if p.number == old_contact.number:
-                    old_priority_entry = p
-                    break
-            
-            was_priority = old_priority_entry is not None
-            
-            # Remove old contact
-            await coordinator.api_client.remove_quick_dial_by_id(entry_id)
-            
-            # Add new contact
-            await coordinator.api_client.add_quick_dial(number, name, code)
-            
-            # Handle priority changes
-            if is_priority and not was_priority:
-                # Add to priority
-                await coordinator.api_client.add_priority_caller(number)
-            elif not is_priority and was_priority:
-                # Remove from priority using old entry ID
-                await coordinator.api_client.remove_priority_caller_by_id(old_priority_entry.id)
-            elif is_priority and was_priority and old_contact.number != number:
-                # Number changed but still priority - remove old, add new
-                await coordinator.api_client.remove_priority_caller_by_id(old_priority_entry.id)
-                await coordinator.api_client.add_priority_caller(number)
-            
-            await coordinator.async_request_refresh()
+            if not entry.id:
+                _LOGGER.debug(
+                    "Skipping blocked entry without ID during clear: %s",
+                    entry,
+                )
+                continue
+
+            await coordinator.api_client.remove_blocked_number_by_id(entry.id)
         except TsuryPhoneAPIError as err:
-            raise HomeAssistantError(f"Failed to edit contact: {err}") from err
+            errors.append(f"Failed to remove {entry.id}: {err}")
 
-    async def async_quick_dial_clear(call: ServiceCall) -> None:
-        context = _require_single_device_context(call)
-        coordinator = context.coordinator
+    await coordinator.async_request_refresh_debounced()
 
-        errors: list[str] = []
-        for entry in list(coordinator.data.quick_dials):
-            try:
-                await coordinator.api_client.remove_quick_dial_by_id(entry.id)
-            except TsuryPhoneAPIError as err:
-                errors.append(f"Failed to remove {entry.id}: {err}")
+    if errors:
+        raise HomeAssistantError(
+            f"Some entries failed to clear: {'; '.join(errors)}"
+        )
 
-        await coordinator.async_request_refresh()
 
-        if errors:
-            raise HomeAssistantError(
-                f"Some entries failed to clear: {'; '.join(errors)}"
-            )
+async def async_get_tsuryphone_config(call: ServiceCall) -> dict[str, Any]:
+    context = _require_single_device_context(call)
+    coordinator = context.coordinator
+    device_id = context.tsury_device_id
 
-    async def async_blocked_add(call: ServiceCall) -> None:
-        context = _require_single_device_context(call)
-        coordinator = context.coordinator
-        number = _normalize_number_for_service(
-            coordinator,
-            call.data["number"],
-            field_name="number",
-            remember=True,
+    try:
+        data = await coordinator.api_client.get_tsuryphone_config()
+        coordinator.hass.bus.async_fire(
+            f"{DOMAIN}_tsuryphone_config",
+            {"device_id": device_id, "config": data},
         )
-        name = call.data["name"].strip()
-        if not name:
-            raise ServiceValidationError("name cannot be empty")
+        return data
+    except TsuryPhoneAPIError as err:
+        raise HomeAssistantError(
+            f"Failed to fetch TsuryPhone config: {err}"
+        ) from err
 
-        try:
-            await coordinator.api_client.add_blocked_number(number, name)
-            await coordinator.async_request_refresh()
-        except TsuryPhoneAPIError as err:
-            raise HomeAssistantError(f"Failed to add blocked number: {err}") from err
 
-    async def async_blocked_remove(call: ServiceCall) -> None:
-        context = _require_single_device_context(call)
-        coordinator = context.coordinator
-        entry_id = call.data.get("id")
+async def async_priority_add(call: ServiceCall) -> None:
+    context = _require_single_device_context(call)
+    coordinator = context.coordinator
+    number = _normalize_number_for_service(
+        coordinator,
+        call.data["number"],
+        field_name="number",
+        remember=True,
+    )
 
-        if not entry_id:
-            raise ServiceValidationError("'id' is required")
+    try:
+        await coordinator.api_client.add_priority_caller(number)
+        await coordinator.async_request_refresh_debounced()
+    except TsuryPhoneAPIError as err:
+        raise HomeAssistantError(f"Failed to add priority caller: {err}") from err
 
-        try:
-            await coordinator.api_client.remove_blocked_number_by_id(entry_id)
-            await coordinator.async_request_refresh()
-        except TsuryPhoneAPIError as err:
-            raise HomeAssistantError(f"Failed to remove blocked number: {err}") from err
 
-    async def async_blocked_clear(call: ServiceCall) -> None:
-        context = _require_single_device_context(call)
-        coordinator = context.coordinator
+async def async_priority_remove(call: ServiceCall) -> None:
+    context = _require_single_device_context(call)
+    coordinator = context.coordinator
+    entry_id = call.data.get("id")
 
-        errors: list[str] = []
-        for entry in list(coordinator.data.blocked_numbers):
-            try:
-                if not entry.id:
-                    _LOGGER.debug(
-                        "Skipping blocked entry without ID during clear: %s",
-                        entry,
-                    )
-                    continue
+    if not entry_id:
+        raise ServiceValidationError("'id' is required")
 
-                await coordinator.api_client.remove_blocked_number_by_id(entry.id)
-            except TsuryPhoneAPIError as err:
-                errors.append(f"Failed to remove {entry.id}: {err}")
+    try:
+        await coordinator.api_client.remove_priority_caller_by_id(entry_id)
+        coordinator.async_apply_local_config({"priority.remove": entry_id})
+    except TsuryPhoneAPIError as err:
+        raise HomeAssistantError(
+            f"Failed to remove priority caller: {err}"
+        ) from err
+
+
+async def async_refetch_all(call: ServiceCall) -> None:
+    context = _require_single_device_context(call)
+    coordinator = context.coordinator
 
+    try:
+        await coordinator.api_client.refetch_all()
         await coordinator.async_request_refresh()
+    except TsuryPhoneAPIError as err:
+        raise HomeAssistantError(f"Failed to refetch data: {err}") from err
 
-        if errors:
-            raise HomeAssistantError(
-                f"Some entries failed to clear: {'; '.join(errors)}"
-            )
 
-    async def async_refetch_all(call: ServiceCall) -> None:
-        context = _require_single_device_context(call)
-        coordinator = context.coordinator
+async def async_get_diagnostics(call: ServiceCall) -> dict[str, Any]:
+    context = _require_single_device_context(call)
+    coordinator = context.coordinator
 
-        try:
-            await coordinator.api_client.refetch_all()
-            await coordinator.async_request_refresh()
-        except TsuryPhoneAPIError as err:
-            raise HomeAssistantError(f"Failed to refetch all data: {err}") from err
+    try:
+        diagnostics = await coordinator.api_client.get_diagnostics()
+        return {"diagnostics": diagnostics}
+    except TsuryPhoneAPIError as err:
+        raise HomeAssistantError(f"Failed to get diagnostics: {err}") from err
 
-    async def async_get_tsuryphone_config(call: ServiceCall) -> dict[str, Any]:
-        context = _require_single_device_context(call)
-        coordinator = context.coordinator
-        device_id = context.tsury_device_id
 
-        try:
-            data = await coordinator.api_client.get_tsuryphone_config()
-            coordinator.hass.bus.async_fire(
-                f"{DOMAIN}_tsuryphone_config",
-                {"device_id": device_id, "config": data},
-            )
-            return data
-        except TsuryPhoneAPIError as err:
-            raise HomeAssistantError(
-                f"Failed to fetch TsuryPhone config: {err}"
-            ) from err
+async def async_webhook_add(call: ServiceCall) -> None:
+    context = _require_single_device_context(call)
+    coordinator = context.coordinator
+    webhook_id = call.data["webhook_id"]
+    code = call.data["code"]
+    name = call.data.get("name", "")
 
-    async def async_priority_add(call: ServiceCall) -> None:
-        context = _require_single_device_context(call)
-        coordinator = context.coordinator
-        number = _normalize_number_for_service(
-            coordinator,
-            call.data["number"],
-            field_name="number",
-            remember=True,
+    try:
+        await coordinator.api_client.add_webhook_action(
+            code=code,
+            webhook_id=webhook_id,
+            action_name=name
         )
+        await coordinator.async_request_refresh_debounced()
+    except TsuryPhoneAPIError as err:
+        raise HomeAssistantError(f"Failed to add webhook: {err}") from err
 
-        try:
-            await coordinator.api_client.add_priority_caller(number)
-            await coordinator.async_request_refresh()
-        except TsuryPhoneAPIError as err:
-            raise HomeAssistantError(f"Failed to add priority caller: {err}") from err
 
-    async def async_priority_remove(call: ServiceCall) -> None:
-        context = _require_single_device_context(call)
-        coordinator = context.coordinator
-        entry_id = call.data.get("id")
+async def async_webhook_remove(call: ServiceCall) -> None:
+    context = _require_single_device_context(call)
+    coordinator = context.coordinator
+    code = call.data["code"]
 
-        if not entry_id:
-            raise ServiceValidationError("'id' is required")
+    try:
+        await coordinator.api_client.remove_webhook_action(code)
+        coordinator.async_apply_local_config({"webhook.remove": code})
+    except TsuryPhoneAPIError as err:
+        raise HomeAssistantError(f"Failed to remove webhook: {err}") from err
 
-        try:
-            await coordinator.api_client.remove_priority_caller_by_id(entry_id)
-            await coordinator.async_request_refresh()
-        except TsuryPhoneAPIError as err:
-            raise HomeAssistantError(
-                f"Failed to remove priority caller: {err}"
-            ) from err
 
-    async def async_refetch_all(call: ServiceCall) -> None:
-        context = _require_single_device_context(call)
-        coordinator = context.coordinator
+async def async_webhook_clear(call: ServiceCall) -> None:
+    context = _require_single_device_context(call)
+    coordinator = context.coordinator
 
-        try:
-            await coordinator.api_client.refetch_all()
-            await coordinator.async_request_refresh()
-        except TsuryPhoneAPIError as err:
-            raise HomeAssistantError(f"Failed to refetch data: {err}") from err
+    try:
+        await coordinator.api_client.clear_webhooks()
+        await coordinator.async_request_refresh_debounced()
+    except TsuryPhoneAPIError as err:
+        raise HomeAssistantError(f"Failed to clear webhooks: {err}") from err
 
-    async def async_get_diagnostics(call: ServiceCall) -> dict[str, Any]:
-        context = _require_single_device_context(call)
-        coordinator = context.coordinator
 
-        try:
-            diagnostics = await coordinator.api_client.get_diagnostics()
-            return {"diagnostics": diagnostics}
-        except TsuryPhoneAPIError as err:
-            raise HomeAssistantError(f"Failed to get diagnostics: {err}") from err
+async_webhook_test = _simple_device_service(
+    "test_webhook", ("url",), "Failed to test webhook: {err}"
+)
 
-    async def async_webhook_add(call: ServiceCall) -> None:
-        context = _require_single_device_context(call)
-        coordinator = context.coordinator
-        webhook_id = call.data["webhook_id"]
-        code = call.data["code"]
-        name = call.data.get("name", "")
 
-        try:
-            await coordinator.api_client.add_webhook_action(
-                code=code,
-                webhook_id=webhook_id,
-                action_name=name
-            )
-            await coordinator.async_request_refresh()
-        except TsuryPhoneAPIError as err:
-            raise HomeAssistantError(f"Failed to add webhook: {err}") from err
+async def async_switch_call_waiting(call: ServiceCall) -> None:
+    context = _require_single_device_context(call)
+    coordinator = context.coordinator
 
-    async def async_webhook_remove(call: ServiceCall) -> None:
-        context = _require_single_device_context(call)
-        coordinator = context.coordinator
-        code = call.data["code"]
+    if not coordinator.data.call_waiting_available:
+        raise ServiceValidationError("Call waiting not available on this device")
 
-        try:
-            await coordinator.api_client.remove_webhook_action(code)
-            await coordinator.async_request_refresh()
-        except TsuryPhoneAPIError as err:
-            raise HomeAssistantError(f"Failed to remove webhook: {err}") from err
+    try:
+        await coordinator.api_client.switch_call_waiting()
+        await coordinator.async_request_refresh()
+    except TsuryPhoneAPIError as err:
+        raise HomeAssistantError(f"Failed to switch call waiting: {err}") from err
 
-    async def async_webhook_clear(call: ServiceCall) -> None:
-        context = _require_single_device_context(call)
-        coordinator = context.coordinator
 
-        try:
-            await coordinator.api_client.clear_webhooks()
-            await coordinator.async_request_refresh()
-        except TsuryPhoneAPIError as err:
-            raise HomeAssistantError(f"Failed to clear webhooks: {err}") from err
+async def async_toggle_volume_mode(call: ServiceCall) -> None:
+    context = _require_single_device_context(call)
+    coordinator = context.coordinator
 
-    async def async_webhook_test(call: ServiceCall) -> None:
-        context = _require_single_device_context(call)
-        coordinator = context.coordinator
-        url = call.data["url"]
+    if not coordinator.data.is_call_active:
+        raise ServiceValidationError("No active call to toggle volume mode")
 
-        try:
-            await coordinator.api_client.test_webhook(url)
-        except TsuryPhoneAPIError as err:
-            raise HomeAssistantError(f"Failed to test webhook: {err}") from err
+    try:
+        await coordinator.api_client.toggle_volume_mode()
+    except TsuryPhoneAPIError as err:
+        raise HomeAssistantError(f"Failed to toggle volume mode: {err}") from err
 
-    async def async_switch_call_waiting(call: ServiceCall) -> None:
-        context = _require_single_device_context(call)
-        coordinator = context.coordinator
 
-        if not coordinator.data.call_waiting_available:
-            raise ServiceValidationError("Call waiting not available on this device")
+async def async_toggle_mute(call: ServiceCall) -> None:
+    context = _require_single_device_context(call)
+    coordinator = context.coordinator
 
-        try:
-            await coordinator.api_client.switch_call_waiting()
-            await coordinator.async_request_refresh()
-        except TsuryPhoneAPIError as err:
-            raise HomeAssistantError(f"Failed to switch call waiting: {err}") from err
+    if not coordinator.data.is_call_active:
+        raise ServiceValidationError("No active call to toggle mute")
 
-    async def async_toggle_volume_mode(call: ServiceCall) -> None:
-        context = _require_single_device_context(call)
-        coordinator = context.coordinator
+    try:
+        await coordinator.api_client.toggle_mute()
+    except TsuryPhoneAPIError as err:
+        raise HomeAssistantError(f"Failed to toggle mute: {err}") from err
 
-        if not coordinator.data.is_call_active:
-            raise ServiceValidationError("No active call to toggle volume mode")
 
-        try:
-            await coordinator.api_client.toggle_volume_mode()
-        except TsuryPhoneAPIError as err:
-            raise HomeAssistantError(f"Failed to toggle volume mode: {err}") from err
+async def async_set_maintenance_mode(call: ServiceCall) -> None:
+    context = _require_single_device_context(call)
+    coordinator = context.coordinator
+    enabled = call.data["enabled"]
 
-    async def async_toggle_mute(call: ServiceCall) -> None:
-        context = _require_single_device_context(call)
-        coordinator = context.coordinator
+    try:
+        await coordinator.api_client.set_maintenance_mode(enabled)
+        coordinator.async_apply_local_config({"maintenance.enabled": enabled})
+    except TsuryPhoneAPIError as err:
+        raise HomeAssistantError(f"Failed to set maintenance mode: {err}") from err
 
-        if not coordinator.data.is_call_active:
-            raise ServiceValidationError("No active call to toggle mute")
 
-        try:
-            await coordinator.api_client.toggle_mute()
-        except TsuryPhoneAPIError as err:
-            raise HomeAssistantError(f"Failed to toggle mute: {err}") from err
+async def async_get_missed_calls(call: ServiceCall) -> dict[str, Any]:
+    context = _require_single_device_context(call)
+    coordinator = context.coordinator
 
-    async def async_set_maintenance_mode(call: ServiceCall) -> None:
-        context = _require_single_device_context(call)
-        coordinator = context.coordinator
-        enabled = call.data["enabled"]
+    return {
+        "missed_calls": await _async_serialize_history(
+            call.hass, _missed_call_entry_to_dict, coordinator.data.missed_calls[:]
+        )
+    }
 
-        try:
-            await coordinator.api_client.set_maintenance_mode(enabled)
-            await coordinator.async_request_refresh()
-        except TsuryPhoneAPIError as err:
-            raise HomeAssistantError(f"Failed to set maintenance mode: {err}") from err
 
-    async def async_get_missed_calls(call: ServiceCall) -> dict[str, Any]:
-        context = _require_single_device_context(call)
-        coordinator = context.coordinator
+async_dial_quick_dial = _simple_device_service(
+    "dial_quick_dial", ("code",), "Failed to dial quick dial code {code}: {err}"
+)
 
-        history = coordinator.data.call_history or []
-        missed_calls = [entry for entry in history if entry.call_type == "missed"]
 
-        return {
-            "missed_calls": [
-                {
-                    "number": entry.number,
-                    "timestamp": (
-                        entry.timestamp.isoformat() if entry.timestamp else None
-                    ),
-                    "call_type": entry.call_type,
-                    "ts_device": entry.ts_device,
-                    "received_ts": entry.received_ts,
-                }
-                for entry in missed_calls
-            ]
+async_set_ha_url = _simple_device_service(
+    "set_ha_url", ("url",), "Failed to set HA URL: {err}"
+)
+
+
+async def async_quick_dial_import(call: ServiceCall) -> dict[str, Any]:
+    context = _require_single_device_context(call)
+    coordinator = context.coordinator
+    entries = call.data["entries"]
+    clear_existing = call.data.get("clear_existing", False)
+    max_concurrency = call.data.get(
+        "max_concurrency", SERVICE_CONCURRENCY_LIMIT
+    )
+
+    results = {"added": [], "skipped": [], "failed": [], "cleared": False}
+
+    # Entries already on the device with identical values need no request
+    known: dict[str, tuple[str, str]] = (
+        {}
+        if clear_existing
+        else {
+            entry.code: (entry.number, entry.name)
+            for entry in coordinator.data.quick_dials
         }
+    )
 
-    async def async_dial_quick_dial(call: ServiceCall) -> None:
-        context = _require_single_device_context(call)
-        coordinator = context.coordinator
-        code = call.data["code"]
+    try:
+        pending: list[dict[str, str]] = []
+        # Local bindings keep attribute lookups out of the per-entry loop
+        pending_append = pending.append
+        skipped_append = results["skipped"].append
+        failed_append = results["failed"].append
+        known_get = known.get
+        log = _LOGGER.log
+
+        for entry in entries:
+            code = entry.get("code")
+            raw_number = entry.get("number")
+            name = entry.get("name")
+
+            if not code:
+                failed_append({"code": code or "", "error": "Missing code"})
+                log(
+                    _import_log_level(results),
+                    "Skipping quick dial entry with missing code: %s",
+                    entry,
+                )
+                continue
+
+            if not name or not str(name).strip():
+                failed_append({"code": code, "error": "Missing quick dial name"})
+                log(
+                    _import_log_level(results),
+                    "Skipping quick dial entry without name: %s",
+                    entry,
+                )
+                continue
 
-        try:
-            await coordinator.api_client.dial_quick_dial(code)
-        except TsuryPhoneAPIError as err:
-            raise HomeAssistantError(
-                f"Failed to dial quick dial code {code}: {err}"
-            ) from err
+            try:
+                number = _normalize_number_for_service(
+                    coordinator,
+                    raw_number,
+                    field_name="number",
+                    remember=True,
+                )
+            except ServiceValidationError as err:
+                failed_append({"code": code, "error": str(err)})
+                log(
+                    _import_log_level(results),
+                    "Failed to normalize quick dial entry %s: %s",
+                    code,
+                    err,
+                )
+                continue
 
-    async def async_set_ha_url(call: ServiceCall) -> None:
-        context = _require_single_device_context(call)
-        coordinator = context.coordinator
-        url = call.data["url"]
+            if known_get(code) == (number, name):
+                skipped_append(code)
+                continue
 
-        try:
-            await coordinator.api_client.set_ha_url(url)
-        except TsuryPhoneAPIError as err:
-            raise HomeAssistantError(f"Failed to set HA URL: {err}") from err
+            pending_append({"code": code, "number": number, "name": name})
 
-    async def async_quick_dial_import(call: ServiceCall) -> dict[str, Any]:
-        context = _require_single_device_context(call)
-        coordinator = context.coordinator
-        entries = call.data["entries"]
-        clear_existing = call.data.get("clear_existing", False)
+        api_client = coordinator.api_client
+        await _async_import_chunks(
+            coordinator,
+            "quick dial entries",
+            "code",
+            pending,
+            api_client.add_quick_dials_bulk,
+            lambda entry: api_client.add_quick_dial(
+                entry["number"], entry["name"], entry["code"]
+            ),
+            api_client.clear_quick_dial,
+            clear_existing,
+            max_concurrency,
+            results,
+        )
 
-        results = {"added": [], "failed": [], "cleared": False}
+        return _import_response(results, call.data.get("verbose", False))
 
-        try:
-            if clear_existing:
-                await coordinator.api_client.clear_quick_dial()
-                results["cleared"] = True
-                _LOGGER.info("Cleared existing quick dial entries")
-
-            for entry in entries:
-                code = entry.get("code")
-                raw_number = entry.get("number")
-                name = entry.get("name")
-
-                if not code:
-                    results["failed"].append(
-                        {"code": code or "", "error": "Missing code"}
-                    )
-                    _LOGGER.warning(
-                        "Skipping quick dial entry with missing code: %s", entry
-                    )
-                    continue
+    except TsuryPhoneAPIError as err:
+        raise HomeAssistantError(
+            f"Failed to import quick dial entries: {err}"
+        ) from err
+    finally:
+        # Report whatever reached the device, even when a chunk failed
+        _async_finish_import(coordinator, "quick_dial", results)
 
-                if not name or not str(name).strip():
-                    results["failed"].append(
-                        {"code": code, "error": "Missing quick dial name"}
-                    )
-                    _LOGGER.warning("Skipping quick dial entry without name: %s", entry)
-                    continue
 
-                try:
-                    number = _normalize_number_for_service(
-                        coordinator,
-                        raw_number,
-                        field_name="number",
-                        remember=True,
-                    )
-                except ServiceValidationError as err:
-                    results["failed"].append({"code": code, "error": str(err)})
-                    _LOGGER.warning(
-                        "Failed to normalize quick dial entry %s: %s", code, err
-                    )
-                    continue
+async def async_quick_dial_export(call: ServiceCall) -> dict[str, Any]:
+    context = _require_single_device_context(call)
+    coordinator = context.coordinator
 
-                try:
-                    await coordinator.api_client.add_quick_dial(number, name, code)
-                    results["added"].append(code)
-                    _LOGGER.debug("Added quick dial entry: %s", code)
-                except TsuryPhoneAPIError as err:
-                    results["failed"].append({"code": code, "error": str(err)})
-                    _LOGGER.warning("Failed to add quick dial entry %s: %s", code, err)
+    # Numbers are already normalized E.164 format
+    return {"entries": coordinator.data.quick_dial_export()}
 
-            await coordinator.async_request_refresh()
-            return results
 
-        except TsuryPhoneAPIError as err:
-            raise HomeAssistantError(
-                f"Failed to import quick dial entries: {err}"
-            ) from err
+async def async_blocked_import(call: ServiceCall) -> dict[str, Any]:
+    context = _require_single_device_context(call)
+    coordinator = context.coordinator
+    entries = call.data["entries"]
+    clear_existing = call.data.get("clear_existing", False)
+    max_concurrency = call.data.get(
+        "max_concurrency", SERVICE_CONCURRENCY_LIMIT
+    )
 
-    async def async_quick_dial_export(call: ServiceCall) -> dict[str, Any]:
-        context = _require_single_device_context(call)
-        coordinator = context.coordinator
+    results = {"added": [], "skipped": [], "failed": [], "cleared": False}
 
-        state = coordinator.data
-        if not state.quick_dials:
-            return {"entries": []}
+    # Numbers already blocked under the same name need no request
+    known: dict[str, str] = (
+        {}
+        if clear_existing
+        else {entry.number: entry.name for entry in coordinator.data.blocked_numbers}
+    )
 
-        entries = [
-            {
-                "code": entry.code,
-                "number": entry.number,  # Already normalized E.164 format
-                "name": entry.name,
-            }
-            for entry in state.quick_dials
-        ]
-        return {"entries": entries}
+    try:
+        pending: list[dict[str, str]] = []
+        # Local bindings keep attribute lookups out of the per-entry loop
+        pending_append = pending.append
+        skipped_append = results["skipped"].append
+        failed_append = results["failed"].append
+        known_get = known.get
+        log = _LOGGER.log
+
+        for entry in entries:
+            raw_number = entry.get("number")
+            name = entry.get("name")
+
+            if not name or not str(name).strip():
+                failed_append({"number": raw_number or "", "error": "Missing name"})
+                log(
+                    _import_log_level(results),
+                    "Skipping blocked number without name: %s",
+                    entry,
+                )
+                continue
+
+            try:
+                number = _normalize_number_for_service(
+                    coordinator,
+                    raw_number,
+                    field_name="number",
+                    remember=True,
+                )
+            except ServiceValidationError as err:
+                failed_append({"number": raw_number or "", "error": str(err)})
+                log(
+                    _import_log_level(results),
+                    "Failed to normalize blocked number %s: %s",
+                    raw_number,
+                    err,
+                )
+                continue
 
-    async def async_blocked_import(call: ServiceCall) -> dict[str, Any]:
-        context = _require_single_device_context(call)
-        coordinator = context.coordinator
-        entries = call.data["entries"]
-        clear_existing = call.data.get("clear_existing", False)
+            name = str(name).strip()
+            if known_get(number) == name:
+                skipped_append(number)
+                continue
 
-        results = {"added": [], "failed": [], "cleared": False}
+            pending_append({"number": number, "name": name})
 
-        try:
-            if clear_existing:
-                await coordinator.api_client.clear_blocked_numbers()
-                results["cleared"] = True
-                _LOGGER.info("Cleared existing blocked numbers")
-
-            for entry in entries:
-                raw_number = entry.get("number")
-                name = entry.get("name")
-
-                if not name or not str(name).strip():
-                    results["failed"].append(
-                        {"number": raw_number or "", "error": "Missing name"}
-                    )
-                    _LOGGER.warning("Skipping blocked number without name: %s", entry)
-                    continue
+        api_client = coordinator.api_client
+        await _async_import_chunks(
+            coordinator,
+            "blocked numbers",
+            "number",
+            pending,
+            api_client.add_blocked_numbers_bulk,
+            lambda entry: api_client.add_blocked_number(
+                entry["number"], entry["name"]
+            ),
+            api_client.clear_blocked_numbers,
+            clear_existing,
+            max_concurrency,
+            results,
+        )
 
-                try:
-                    number = _normalize_number_for_service(
-                        coordinator,
-                        raw_number,
-                        field_name="number",
-                        remember=True,
-                    )
-                except ServiceValidationError as err:
-                    results["failed"].append(
-                        {"number": raw_number or "", "error": str(err)}
-                    )
-                    _LOGGER.warning(
-                        "Failed to normalize blocked number %s: %s", raw_number, err
-                    )
-                    continue
+        return _import_response(results, call.data.get("verbose", False))
 
-                name = str(name).strip()
+    except TsuryPhoneAPIError as err:
+        raise HomeAssistantError(
+            f"Failed to import blocked numbers: {err}"
+        ) from err
+    finally:
+        # Report whatever reached the device, even when a chunk failed
+        _async_finish_import(coordinator, "blocked", results)
 
-                try:
-                    await coordinator.api_client.add_blocked_number(number, name)
-                    results["added"].append(number)
-                    _LOGGER.debug("Added blocked number: %s", number)
-                except TsuryPhoneAPIError as err:
-                    results["failed"].append({"number": number, "error": str(err)})
-                    _LOGGER.warning("Failed to add blocked number %s: %s", number, err)
 
-            await coordinator.async_request_refresh()
-            return results
+async def async_blocked_export(call: ServiceCall) -> dict[str, Any]:
+    context = _require_single_device_context(call)
+    coordinator = context.coordinator
 
-        except TsuryPhoneAPIError as err:
-            raise HomeAssistantError(
-                f"Failed to import blocked numbers: {err}"
-            ) from err
+    # Numbers are already normalized E.164 format
+    return {"entries": coordinator.data.blocked_export()}
+
+
+_SERVICES_CONFIG: Final = (
+    (SERVICE_DIAL, async_dial, DIAL_SCHEMA),
+    (SERVICE_DIAL_DIGIT, async_dial_digit, DIAL_DIGIT_SCHEMA),
+    (SERVICE_SEND_DTMF, async_send_dtmf, SEND_DTMF_SCHEMA),
+    (SERVICE_DELETE_LAST_DIGIT, async_delete_last_digit, DEVICE_ONLY_SCHEMA),
+    (SERVICE_ANSWER, async_answer, DEVICE_ONLY_SCHEMA),
+    (SERVICE_HANGUP, async_hangup, DEVICE_ONLY_SCHEMA),
+    (SERVICE_RING_DEVICE, async_ring_device, RING_DEVICE_SCHEMA),
+    (SERVICE_STOP_RINGING, async_stop_ringing, DEVICE_ONLY_SCHEMA),
+    (SERVICE_SET_RING_PATTERN, async_set_ring_pattern, SET_RING_PATTERN_SCHEMA),
+    (SERVICE_RESET_DEVICE, async_reset_device, DEVICE_ONLY_SCHEMA),
+    (
+        SERVICE_FACTORY_RESET_DEVICE,
+        async_factory_reset_device,
+        DEVICE_ONLY_SCHEMA,
+    ),
+    (SERVICE_SET_DND, async_set_dnd, SET_DND_SCHEMA),
+    (SERVICE_SET_AUDIO, async_set_audio, SET_AUDIO_SCHEMA),
+    (
+        SERVICE_SET_DIALING_CONFIG,
+        async_set_dialing_config,
+        SET_DIALING_CONFIG_SCHEMA,
+    ),
+    (SERVICE_GET_CALL_HISTORY, async_get_call_history, CALL_HISTORY_SCHEMA),
+    (
+        SERVICE_CLEAR_CALL_HISTORY,
+        async_clear_call_history,
+        CALL_HISTORY_CLEAR_SCHEMA,
+    ),
+    (SERVICE_QUICK_DIAL_ADD, async_quick_dial_add, QUICK_DIAL_ADD_SCHEMA),
+    (SERVICE_QUICK_DIAL_REMOVE, async_quick_dial_remove, QUICK_DIAL_REMOVE_SCHEMA),
+    (SERVICE_QUICK_DIAL_CLEAR, async_quick_dial_clear, DEVICE_ONLY_SCHEMA),
+    (SERVICE_BLOCKED_ADD, async_blocked_add, BLOCKED_ADD_SCHEMA),
+    (SERVICE_BLOCKED_REMOVE, async_blocked_remove, BLOCKED_REMOVE_SCHEMA),
+    (SERVICE_BLOCKED_CLEAR, async_blocked_clear, DEVICE_ONLY_SCHEMA),
+    (SERVICE_PRIORITY_ADD, async_priority_add, PRIORITY_ADD_SCHEMA),
+    (SERVICE_PRIORITY_REMOVE, async_priority_remove, PRIORITY_REMOVE_SCHEMA),
+    (SERVICE_REFETCH_ALL, async_refetch_all, DEVICE_ONLY_SCHEMA),
+    (
+        SERVICE_GET_TSURYPHONE_CONFIG,
+        async_get_tsuryphone_config,
+        DEVICE_ONLY_SCHEMA,
+    ),
+    (SERVICE_GET_DIAGNOSTICS, async_get_diagnostics, DEVICE_ONLY_SCHEMA),
+    (SERVICE_WEBHOOK_ADD, async_webhook_add, WEBHOOK_ADD_SCHEMA),
+    (SERVICE_WEBHOOK_REMOVE, async_webhook_remove, WEBHOOK_REMOVE_SCHEMA),
+    (SERVICE_WEBHOOK_CLEAR, async_webhook_clear, DEVICE_ONLY_SCHEMA),
+    (SERVICE_WEBHOOK_TEST, async_webhook_test, WEBHOOK_TEST_SCHEMA),
+    (SERVICE_SWITCH_CALL_WAITING, async_switch_call_waiting, DEVICE_ONLY_SCHEMA),
+    (SERVICE_TOGGLE_VOLUME_MODE, async_toggle_volume_mode, DEVICE_ONLY_SCHEMA),
+    (SERVICE_TOGGLE_MUTE, async_toggle_mute, DEVICE_ONLY_SCHEMA),
+    (SERVICE_EDIT_CONTACT, async_edit_contact, EDIT_CONTACT_SCHEMA),
+    (
+        SERVICE_SET_MAINTENANCE_MODE,
+        async_set_maintenance_mode,
+        MAINTENANCE_MODE_SCHEMA,
+    ),
+    (SERVICE_GET_MISSED_CALLS, async_get_missed_calls, DEVICE_ONLY_SCHEMA),
+    (SERVICE_DIAL_QUICK_DIAL, async_dial_quick_dial, DIAL_QUICK_DIAL_SCHEMA),
+    (SERVICE_SET_HA_URL, async_set_ha_url, SET_HA_URL_SCHEMA),
+    (SERVICE_QUICK_DIAL_IMPORT, async_quick_dial_import, QUICK_DIAL_IMPORT_SCHEMA),
+    (SERVICE_QUICK_DIAL_EXPORT, async_quick_dial_export, DEVICE_ONLY_SCHEMA),
+    (SERVICE_BLOCKED_IMPORT, async_blocked_import, BLOCKED_IMPORT_SCHEMA),
+    (SERVICE_BLOCKED_EXPORT, async_blocked_export, DEVICE_ONLY_SCHEMA),
+    # Phase P8: Resilience services
+    (SERVICE_RESILIENCE_STATUS, async_resilience_status, DEVICE_ONLY_SCHEMA),
+    (SERVICE_RESILIENCE_TEST, async_resilience_test, RESILIENCE_TEST_SCHEMA),
+    (SERVICE_WEBSOCKET_RECONNECT, async_websocket_reconnect, DEVICE_ONLY_SCHEMA),
+    (SERVICE_RUN_HEALTH_CHECK, async_run_health_check, DEVICE_ONLY_SCHEMA),
+)
 
-    async def async_blocked_export(call: ServiceCall) -> dict[str, Any]:
-        context = _require_single_device_context(call)
-        coordinator = context.coordinator
+_SERVICE_NAMES: Final = tuple(service_name for service_name, _, _ in _SERVICES_CONFIG)
 
-        state = coordinator.data
-        if not state.blocked_numbers:
-            return {"entries": []}
+# Services that return data need SupportsResponse.OPTIONAL
+_RESPONSE_SERVICES: Final = frozenset(
+    {
+        SERVICE_GET_CALL_HISTORY,
+        SERVICE_GET_TSURYPHONE_CONFIG,
+        SERVICE_GET_DIAGNOSTICS,
+        SERVICE_GET_MISSED_CALLS,
+        SERVICE_QUICK_DIAL_IMPORT,
+        SERVICE_QUICK_DIAL_EXPORT,
+        SERVICE_BLOCKED_IMPORT,
+        SERVICE_BLOCKED_EXPORT,
+        # Phase P8: Resilience services with responses
+        SERVICE_RESILIENCE_STATUS,
+        SERVICE_RESILIENCE_TEST,
+        SERVICE_WEBSOCKET_RECONNECT,
+        SERVICE_RUN_HEALTH_CHECK,
+    }
+)
 
-        entries = [
-            {
-                "number": entry.number,  # Already normalized E.164 format
-                "name": entry.name,
-            }
-            for entry in state.blocked_numbers
-        ]
-        return {"entries": entries}
-
-    # Register all services
-    services_config = [
-        (SERVICE_DIAL, async_dial, DIAL_SCHEMA),
-        (SERVICE_DIAL_DIGIT, async_dial_digit, DIAL_DIGIT_SCHEMA),
-        (SERVICE_SEND_DTMF, async_send_dtmf, SEND_DTMF_SCHEMA),
-        (SERVICE_DELETE_LAST_DIGIT, async_delete_last_digit, DEVICE_ONLY_SCHEMA),
-        (SERVICE_ANSWER, async_answer, DEVICE_ONLY_SCHEMA),
-        (SERVICE_HANGUP, async_hangup, DEVICE_ONLY_SCHEMA),
-        (SERVICE_RING_DEVICE, async_ring_device, RING_DEVICE_SCHEMA),
-        (SERVICE_STOP_RINGING, async_stop_ringing, DEVICE_ONLY_SCHEMA),
-        (SERVICE_SET_RING_PATTERN, async_set_ring_pattern, SET_RING_PATTERN_SCHEMA),
-        (SERVICE_RESET_DEVICE, async_reset_device, DEVICE_ONLY_SCHEMA),
-        (
-            SERVICE_FACTORY_RESET_DEVICE,
-            async_factory_reset_device,
-            DEVICE_ONLY_SCHEMA,
-        ),
-        (SERVICE_SET_DND, async_set_dnd, SET_DND_SCHEMA),
-        (SERVICE_SET_AUDIO, async_set_audio, SET_AUDIO_SCHEMA),
-        (
-            SERVICE_SET_DIALING_CONFIG,
-            async_set_dialing_config,
-            SET_DIALING_CONFIG_SCHEMA,
-        ),
-        (SERVICE_GET_CALL_HISTORY, async_get_call_history, CALL_HISTORY_SCHEMA),
-        (
-            SERVICE_CLEAR_CALL_HISTORY,
-            async_clear_call_history,
-            CALL_HISTORY_CLEAR_SCHEMA,
-        ),
-        (SERVICE_QUICK_DIAL_ADD, async_quick_dial_add, QUICK_DIAL_ADD_SCHEMA),
-        (SERVICE_QUICK_DIAL_REMOVE, async_quick_dial_remove, QUICK_DIAL_REMOVE_SCHEMA),
-        (SERVICE_QUICK_DIAL_CLEAR, async_quick_dial_clear, DEVICE_ONLY_SCHEMA),
-        (SERVICE_BLOCKED_ADD, async_blocked_add, BLOCKED_ADD_SCHEMA),
-        (SERVICE_BLOCKED_REMOVE, async_blocked_remove, BLOCKED_REMOVE_SCHEMA),
-        (SERVICE_BLOCKED_CLEAR, async_blocked_clear, DEVICE_ONLY_SCHEMA),
-        (SERVICE_PRIORITY_ADD, async_priority_add, PRIORITY_ADD_SCHEMA),
-        (SERVICE_PRIORITY_REMOVE, async_priority_remove, PRIORITY_REMOVE_SCHEMA),
-        (SERVICE_REFETCH_ALL, async_refetch_all, DEVICE_ONLY_SCHEMA),
-        (
-            SERVICE_GET_TSURYPHONE_CONFIG,
-            async_get_tsuryphone_config,
-            DEVICE_ONLY_SCHEMA,
-        ),
-        (SERVICE_GET_DIAGNOSTICS, async_get_diagnostics, DEVICE_ONLY_SCHEMA),
-        (SERVICE_WEBHOOK_ADD, async_webhook_add, WEBHOOK_ADD_SCHEMA),
-        (SERVICE_WEBHOOK_REMOVE, async_webhook_remove, WEBHOOK_REMOVE_SCHEMA),
-        (SERVICE_WEBHOOK_CLEAR, async_webhook_clear, DEVICE_ONLY_SCHEMA),
-        (SERVICE_WEBHOOK_TEST, async_webhook_test, WEBHOOK_TEST_SCHEMA),
-        (SERVICE_SWITCH_CALL_WAITING, async_switch_call_waiting, DEVICE_ONLY_SCHEMA),
-        (SERVICE_TOGGLE_VOLUME_MODE, async_toggle_volume_mode, DEVICE_ONLY_SCHEMA),
-        (SERVICE_TOGGLE_MUTE, async_toggle_mute, DEVICE_ONLY_SCHEMA),
-        (SERVICE_EDIT_CONTACT, async_edit_contact, EDIT_CONTACT_SCHEMA),
-        (
-            SERVICE_SET_MAINTENANCE_MODE,
-            async_set_maintenance_mode,
-            MAINTENANCE_MODE_SCHEMA,
-        ),
-        (SERVICE_GET_MISSED_CALLS, async_get_missed_calls, DEVICE_ONLY_SCHEMA),
-        (SERVICE_DIAL_QUICK_DIAL, async_dial_quick_dial, DIAL_QUICK_DIAL_SCHEMA),
-        (SERVICE_SET_HA_URL, async_set_ha_url, SET_HA_URL_SCHEMA),
-        (SERVICE_QUICK_DIAL_IMPORT, async_quick_dial_import, QUICK_DIAL_IMPORT_SCHEMA),
-        (SERVICE_QUICK_DIAL_EXPORT, async_quick_dial_export, DEVICE_ONLY_SCHEMA),
-        (SERVICE_BLOCKED_IMPORT, async_blocked_import, BLOCKED_IMPORT_SCHEMA),
-        (SERVICE_BLOCKED_EXPORT, async_blocked_export, DEVICE_ONLY_SCHEMA),
-        # Phase P8: Resilience services
-        (SERVICE_RESILIENCE_STATUS, async_resilience_status, DEVICE_ONLY_SCHEMA),
-        (SERVICE_RESILIENCE_TEST, async_resilience_test, RESILIENCE_TEST_SCHEMA),
-        (SERVICE_WEBSOCKET_RECONNECT, async_websocket_reconnect, DEVICE_ONLY_SCHEMA),
-        (SERVICE_RUN_HEALTH_CHECK, async_run_health_check, DEVICE_ONLY_SCHEMA),
-    ]
-
-    for service_name, service_func, schema in services_config:
-        # Services that return data need SupportsResponse.OPTIONAL
+
+async def async_setup_services(hass: HomeAssistant) -> None:
+    """Set up services for TsuryPhone integration."""
+    for service_name, service_func, schema in _SERVICES_CONFIG:
         supports_response = (
             SupportsResponse.OPTIONAL
-            if service_name
-            in [
-                SERVICE_GET_CALL_HISTORY,
-                SERVICE_GET_TSURYPHONE_CONFIG,
-                SERVICE_GET_DIAGNOSTICS,
-                SERVICE_GET_MISSED_CALLS,
-                SERVICE_QUICK_DIAL_IMPORT,
-                SERVICE_QUICK_DIAL_EXPORT,
-                SERVICE_BLOCKED_IMPORT,
-                SERVICE_BLOCKED_EXPORT,
-                # Phase P8: Resilience services with responses
-                SERVICE_RESILIENCE_STATUS,
-                SERVICE_RESILIENCE_TEST,
-                SERVICE_WEBSOCKET_RECONNECT,
-                SERVICE_RUN_HEALTH_CHECK,
-            ]
+            if service_name in _RESPONSE_SERVICES
             else SupportsResponse.NONE
         )
 
@@ -1620,58 +2019,8 @@ async def async_setup_services(hass: HomeAssistant) -> None:
 
 async def async_unload_services(hass: HomeAssistant) -> None:
     """Unload services for TsuryPhone integration."""
-    services_to_remove = [
-        SERVICE_DIAL,
-        SERVICE_DIAL_DIGIT,
-        SERVICE_SEND_DTMF,
-        SERVICE_DELETE_LAST_DIGIT,
-        SERVICE_ANSWER,
-        SERVICE_HANGUP,
-        SERVICE_RING_DEVICE,
-        SERVICE_STOP_RINGING,
-        SERVICE_SET_RING_PATTERN,
-        SERVICE_RESET_DEVICE,
-        SERVICE_FACTORY_RESET_DEVICE,
-        SERVICE_SET_DND,
-        SERVICE_SET_AUDIO,
-        SERVICE_SET_DIALING_CONFIG,
-        SERVICE_GET_CALL_HISTORY,
-        SERVICE_CLEAR_CALL_HISTORY,
-        SERVICE_QUICK_DIAL_ADD,
-        SERVICE_QUICK_DIAL_REMOVE,
-        SERVICE_QUICK_DIAL_CLEAR,
-        SERVICE_EDIT_CONTACT,
-        SERVICE_BLOCKED_ADD,
-        SERVICE_BLOCKED_REMOVE,
-        SERVICE_BLOCKED_CLEAR,
-        SERVICE_PRIORITY_ADD,
-        SERVICE_PRIORITY_REMOVE,
-        SERVICE_REFETCH_ALL,
-        SERVICE_GET_TSURYPHONE_CONFIG,
-        SERVICE_GET_DIAGNOSTICS,
-        SERVICE_WEBHOOK_ADD,
-        SERVICE_WEBHOOK_REMOVE,
-        SERVICE_WEBHOOK_CLEAR,
-        SERVICE_WEBHOOK_TEST,
-        SERVICE_SWITCH_CALL_WAITING,
-        SERVICE_TOGGLE_VOLUME_MODE,
-        SERVICE_TOGGLE_MUTE,
-        SERVICE_SET_MAINTENANCE_MODE,
-        SERVICE_GET_MISSED_CALLS,
-        SERVICE_DIAL_QUICK_DIAL,
-        SERVICE_SET_HA_URL,
-        SERVICE_QUICK_DIAL_IMPORT,
-        SERVICE_QUICK_DIAL_EXPORT,
-        SERVICE_BLOCKED_IMPORT,
-        SERVICE_BLOCKED_EXPORT,
-        # Phase P8: Resilience services
-        SERVICE_RESILIENCE_STATUS,
-        SERVICE_RESILIENCE_TEST,
-        SERVICE_WEBSOCKET_RECONNECT,
-        SERVICE_RUN_HEALTH_CHECK,
-    ]
-
-    for service_name in services_to_remove:
+    # async_remove is a synchronous callback, nothing to gather
+    for service_name in _SERVICE_NAMES:
         hass.services.async_remove(DOMAIN, service_name)
 
     _LOGGER.info("TsuryPhone services unloaded successfully")
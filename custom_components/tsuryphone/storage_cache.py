@@ -2,12 +2,21 @@
 
 from __future__ import annotations
 
+import asyncio
+import heapq
 import json
 import logging
-from datetime import datetime, timedelta
+import operator
+import time
+from bisect import bisect_right
+from collections import deque
+from collections.abc import Callable, Iterable, Mapping
+from datetime import datetime
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.storage import Store
 from homeassistant.util import dt as dt_util
 
@@ -31,6 +40,60 @@ DEFAULT_CALL_HISTORY_RETENTION_DAYS = 30
 DEFAULT_STATE_BACKUP_RETENTION_DAYS = 7
 DEFAULT_MAX_CALL_HISTORY_ENTRIES = 1000
 
+# Delay used to coalesce bursts of history/state writes into one disk write
+STORAGE_SAVE_DELAY = 5  # seconds
+
+SECONDS_PER_DAY = 86400
+
+# Errors from the frequent save paths are logged at most this many times per
+# window so a failing disk does not flood the log
+ERROR_LOG_BURST = 5
+ERROR_LOG_WINDOW = 60  # seconds
+
+
+def _timestamp_from_datetime(value: datetime) -> datetime:
+    """Normalize a datetime to aware UTC."""
+    if value.tzinfo:
+        return dt_util.as_utc(value)
+    return value.replace(tzinfo=dt_util.UTC)
+
+
+def _timestamp_from_number(value: float) -> datetime | None:
+    """Convert an epoch timestamp to an aware UTC datetime."""
+    try:
+        return dt_util.utc_from_timestamp(float(value))
+    except (ValueError, OSError):
+        return None
+
+
+@lru_cache(maxsize=256)
+def _timestamp_from_string(value: str) -> datetime | None:
+    """Parse an ISO or epoch timestamp string to an aware UTC datetime."""
+    parsed = dt_util.parse_datetime(value)
+    if parsed:
+        return dt_util.as_utc(parsed)
+    return _timestamp_from_number(value)
+
+
+@lru_cache(maxsize=8)
+def _iso_at(second: int) -> str:
+    """Format an epoch second as an ISO 8601 UTC timestamp."""
+    return dt_util.utc_from_timestamp(second).isoformat()
+
+
+def _iso_now() -> str:
+    """Return the current UTC time, reusing the string within the same second."""
+    return _iso_at(int(time.time()))
+
+
+# Backup timestamps repeat across cleanup runs, so string parsing is cached
+_TIMESTAMP_PARSERS: dict[type, Callable[[Any], datetime | None]] = {
+    datetime: _timestamp_from_datetime,
+    int: _timestamp_from_number,
+    float: _timestamp_from_number,
+    str: _timestamp_from_string,
+}
+
 
 class TsuryPhoneStorageCache:
     """Manage persistent storage cache for TsuryPhone data."""
@@ -41,10 +104,13 @@ class TsuryPhoneStorageCache:
         self.device_id = device_id
 
         # Create store instances for different data types
+        # Call history can hold up to the entry cap, so encode it on the
+        # executor; the saved entry list is never mutated after it is built
         self._call_history_store = Store(
             hass,
             STORAGE_VERSION_CALL_HISTORY,
             f"{DOMAIN}_{device_id}_{STORAGE_KEY_CALL_HISTORY}",
+            serialize_in_event_loop=False,
         )
         self._device_state_store = Store(
             hass,
@@ -62,38 +128,56 @@ class TsuryPhoneStorageCache:
         self.state_backup_retention_days = DEFAULT_STATE_BACKUP_RETENTION_DAYS
         self.max_call_history_entries = DEFAULT_MAX_CALL_HISTORY_ENTRIES
 
-        # In-memory cache
-        self._call_history_cache: list[CallHistoryEntry] = []
+        # In-memory cache, oldest-first and bounded to the retention cap
+        self._call_history_cache: deque[CallHistoryEntry] = deque(
+            maxlen=self.max_call_history_entries
+        )
         self._device_state_cache: dict[str, Any] = {}
         self._cache_loaded = False
+        self._device_state_loaded = False
+        # Config backups, kept after the first read so saves don't re-parse
+        # the whole backup file
+        self._config_backups: list[dict[str, Any]] | None = None
+
+        # Per-message (count, window start) for rate-limited error logging
+        self._error_log_windows: dict[str, tuple[int, float]] = {}
+
+        # Entries from the last call history save, used to skip no-op writes
+        self._saved_call_history: list[CallHistoryEntry] | None = None
+
+        # Latest payloads handed to the delayed Store writes
+        self._pending_call_history_data: dict[str, Any] | None = None
+        self._pending_device_state_data: dict[str, Any] | None = None
 
     @staticmethod
     def _parse_timestamp(value: Any) -> datetime | None:
         """Convert supported timestamp representations to an aware UTC datetime."""
-        if value is None:
+        parser = _TIMESTAMP_PARSERS.get(type(value))
+        if parser is None:
             return None
-
-        if isinstance(value, datetime):
-            if value.tzinfo:
-                return dt_util.as_utc(value)
-            return value.replace(tzinfo=dt_util.UTC)
-
-        if isinstance(value, (int, float)):
-            try:
-                return dt_util.utc_from_timestamp(float(value))
-            except (ValueError, OSError):
-                return None
-
-        if isinstance(value, str):
-            parsed = dt_util.parse_datetime(value)
-            if parsed:
-                return dt_util.as_utc(parsed)
-            try:
-                return dt_util.utc_from_timestamp(float(value))
-            except (ValueError, OSError):
-                return None
-
-        return None
+        return parser(value)
+
+    def _log_error(self, message: str, err: Exception) -> None:
+        """Log a save error, dropping repeats while the storage backend flaps."""
+        now = time.monotonic()
+        count, window_start = self._error_log_windows.get(message, (0, now))
+        if now - window_start > ERROR_LOG_WINDOW:
+            count, window_start = 0, now
+        count += 1
+        self._error_log_windows[message] = (count, window_start)
+
+        if count > ERROR_LOG_BURST:
+            return
+        if count == ERROR_LOG_BURST:
+            _LOGGER.error(
+                "%s: %s (suppressing repeats for up to %d seconds)",
+                message,
+                err,
+                ERROR_LOG_WINDOW,
+            )
+            return
+        # Only the first error in a window carries the traceback
+        _LOGGER.error("%s: %s", message, err, exc_info=count == 1)
 
     async def async_initialize(self) -> None:
         """Initialize the storage cache."""
@@ -101,61 +185,103 @@ class TsuryPhoneStorageCache:
         _LOGGER.debug("Storage cache initialized for device %s", self.device_id)
 
     async def _load_cache(self) -> None:
-        """Load data from storage into memory cache."""
+        """Load call history from storage into memory cache."""
         try:
-            # Load call history
             call_history_data = await self._call_history_store.async_load()
-            
+
             if call_history_data:
                 entries_raw = call_history_data.get("entries", [])
-                self._call_history_cache = [
+                entries = [
                     CallHistoryEntry.from_dict(entry)
                     for entry in entries_raw
                 ]
+                # Persisted entries are newest-first; keep the in-memory
+                # history oldest-first like the live coordinator state.
+                entries.sort(key=lambda entry: entry.received_ts)
+                self._call_history_cache.clear()
+                self._call_history_cache.extend(entries)
+
+        except Exception as err:
+            _LOGGER.error("Failed to load call history cache: %s", err, exc_info=True)
 
-            # Load device state backup
+        # Continue without cache on errors
+        self._cache_loaded = True
+
+    async def _load_device_state_cache(self) -> None:
+        """Load the device state backup on first use."""
+        try:
             device_state_data = await self._device_state_store.async_load()
             if device_state_data:
                 self._device_state_cache = device_state_data.get("state", {})
 
-            self._cache_loaded = True
-
         except Exception as err:
-            _LOGGER.error("Failed to load storage cache: %s", err, exc_info=True)
-            self._cache_loaded = True  # Continue without cache
+            _LOGGER.error("Failed to load device state cache: %s", err, exc_info=True)
+
+        self._device_state_loaded = True
 
     async def async_save_call_history(
-        self, call_history: list[CallHistoryEntry]
+        self, call_history: list[CallHistoryEntry], *, skip_cleanup: bool = False
     ) -> None:
-        """Save call history to persistent storage."""
+        """Save call history to persistent storage.
+
+        With skip_cleanup, call_history must already be the newest-first
+        output of _cleanup_call_history.
+        """
         if not self._cache_loaded:
             await self._load_cache()
 
         try:
-            # Update in-memory cache
-            self._call_history_cache = call_history.copy()
-
-            # Clean up old entries before saving
-            cleaned_entries = await self._cleanup_call_history(call_history)
-
-            # Convert to serializable format
+            # Update in-memory cache; the deque keeps only the newest entries
+            self._call_history_cache.clear()
+            if skip_cleanup:
+                self._call_history_cache.extend(reversed(call_history))
+                cleaned_entries = call_history
+            else:
+                self._call_history_cache.extend(call_history)
+                # Clean up old entries before saving
+                cleaned_entries = await self._cleanup_call_history(call_history)
+
+            # Entries are not mutated once they are in the history, so the
+            # same objects in the same order means there is nothing to write
+            saved_entries = self._saved_call_history
+            if (
+                saved_entries is not None
+                and len(cleaned_entries) == len(saved_entries)
+                and all(map(operator.is_, cleaned_entries, saved_entries))
+            ):
+                return
+            self._saved_call_history = cleaned_entries
+
+            # Store encodes with orjson, which serializes the entry dataclasses
+            # field-for-field like CallHistoryEntry.to_dict() without the
+            # intermediate dicts
             data = {
-                "entries": [entry.to_dict() for entry in cleaned_entries],
-                "last_updated": dt_util.utcnow().isoformat(),
+                "entries": cleaned_entries,
+                "last_updated": _iso_now(),
                 "device_id": self.device_id,
             }
 
-            await self._call_history_store.async_save(data)
+            # Bursts of call events collapse into a single delayed write
+            self._pending_call_history_data = data
+            self._call_history_store.async_delay_save(
+                self._pending_call_history, STORAGE_SAVE_DELAY
+            )
 
         except Exception as err:
-            _LOGGER.error("Failed to save call history: %s", err, exc_info=True)
+            self._log_error("Failed to save call history", err)
+
+    @callback
+    def _pending_call_history(self) -> dict[str, Any]:
+        """Hand the call history payload to a delayed save."""
+        data, self._pending_call_history_data = self._pending_call_history_data, None
+        return data or {}
 
     async def async_load_call_history(self) -> list[CallHistoryEntry]:
         """Load call history from persistent storage."""
         if not self._cache_loaded:
             await self._load_cache()
 
-        return self._call_history_cache.copy()
+        return list(self._call_history_cache)
 
     async def async_save_device_state(
         self, state: TsuryPhoneState, send_mode_enabled: bool = False
@@ -163,36 +289,39 @@ class TsuryPhoneStorageCache:
         """Save device state backup to persistent storage."""
         try:
             # Create state backup (excluding sensitive data)
+            dnd_config = state.dnd_config
+            audio_config = state.audio_config
+            stats = state.stats
             state_backup = {
                 "app_state": state.app_state.value,
                 "connected": state.connected,
                 "last_seen": state.last_seen,
                 "send_mode_enabled": send_mode_enabled,
                 "dnd_config": {
-                    "force": state.dnd_config.force,
-                    "scheduled": state.dnd_config.scheduled,
-                    "start_hour": state.dnd_config.start_hour,
-                    "start_minute": state.dnd_config.start_minute,
-                    "end_hour": state.dnd_config.end_hour,
-                    "end_minute": state.dnd_config.end_minute,
+                    "force": dnd_config.force,
+                    "scheduled": dnd_config.scheduled,
+                    "start_hour": dnd_config.start_hour,
+                    "start_minute": dnd_config.start_minute,
+                    "end_hour": dnd_config.end_hour,
+                    "end_minute": dnd_config.end_minute,
                 },
                 "audio_config": {
-                    "earpiece_volume": state.audio_config.earpiece_volume,
-                    "earpiece_gain": state.audio_config.earpiece_gain,
-                    "speaker_volume": state.audio_config.speaker_volume,
-                    "speaker_gain": state.audio_config.speaker_gain,
+                    "earpiece_volume": audio_config.earpiece_volume,
+                    "earpiece_gain": audio_config.earpiece_gain,
+                    "speaker_volume": audio_config.speaker_volume,
+                    "speaker_gain": audio_config.speaker_gain,
                 },
                 "ring_pattern": state.ring_pattern,
                 "maintenance_mode": state.maintenance_mode,
                 "stats": {
-                    "calls_total": state.stats.calls_total,
-                    "calls_incoming": state.stats.calls_incoming,
-                    "calls_outgoing": state.stats.calls_outgoing,
-                    "calls_blocked": state.stats.calls_blocked,
-                    "talk_time_seconds": state.stats.talk_time_seconds,
-                    "uptime_seconds": state.stats.uptime_seconds,
-                    "free_heap_bytes": state.stats.free_heap_bytes,
-                    "rssi_dbm": state.stats.rssi_dbm,
+                    "calls_total": stats.calls_total,
+                    "calls_incoming": stats.calls_incoming,
+                    "calls_outgoing": stats.calls_outgoing,
+                    "calls_blocked": stats.calls_blocked,
+                    "talk_time_seconds": stats.talk_time_seconds,
+                    "uptime_seconds": stats.uptime_seconds,
+                    "free_heap_bytes": stats.free_heap_bytes,
+                    "rssi_dbm": stats.rssi_dbm,
                 },
                 "quick_dial_count": state.quick_dial_count,
                 "blocked_count": state.blocked_count,
@@ -200,69 +329,124 @@ class TsuryPhoneStorageCache:
                 "last_seq": state.last_seq,
             }
 
+            # Nothing changed since the last snapshot; skip the write
+            if state_backup == self._device_state_cache:
+                return
+
             data = {
                 "state": state_backup,
-                "last_updated": dt_util.utcnow().isoformat(),
+                "last_updated": _iso_now(),
                 "device_id": self.device_id,
             }
 
-            await self._device_state_store.async_save(data)
+            self._pending_device_state_data = data
+            self._device_state_store.async_delay_save(
+                self._pending_device_state, STORAGE_SAVE_DELAY
+            )
             self._device_state_cache = state_backup
+            self._device_state_loaded = True
 
         except Exception as err:
-            _LOGGER.error("Failed to save device state to cache: %s", err)
+            self._log_error("Failed to save device state to cache", err)
+
+    @callback
+    def _pending_device_state(self) -> dict[str, Any]:
+        """Hand the device state payload to a delayed save."""
+        data, self._pending_device_state_data = self._pending_device_state_data, None
+        return data or {}
+
+    async def async_flush(self) -> None:
+        """Write any delayed call history or device state saves now."""
+        try:
+            # Drop each payload once written so a second flush is a no-op
+            if self._pending_call_history_data is not None:
+                await self._call_history_store.async_save(
+                    self._pending_call_history_data
+                )
+                self._pending_call_history_data = None
+            if self._pending_device_state_data is not None:
+                await self._device_state_store.async_save(
+                    self._pending_device_state_data
+                )
+                self._pending_device_state_data = None
+        except Exception as err:
+            _LOGGER.error("Failed to flush storage cache: %s", err)
 
     async def async_load_device_state(self) -> dict[str, Any]:
         """Load device state backup from persistent storage."""
-        if not self._cache_loaded:
-            await self._load_cache()
+        if not self._device_state_loaded:
+            await self._load_device_state_cache()
 
         return self._device_state_cache.copy()
 
+    async def async_peek_device_state(self) -> Mapping[str, Any]:
+        """Return a read-only view of the device state backup without copying."""
+        if not self._device_state_loaded:
+            await self._load_device_state_cache()
+
+        return MappingProxyType(self._device_state_cache)
+
     async def async_save_config_backup(self, config_data: dict[str, Any]) -> None:
         """Save configuration backup to persistent storage."""
         try:
-            # Create timestamped backup entry
+            # Create timestamped backup entry; ts_epoch lets retention compare
+            # floats instead of parsing the ISO string
+            now = int(time.time())
             backup_entry = {
-                "timestamp": dt_util.utcnow().isoformat(),
+                "timestamp": _iso_at(now),
+                "ts_epoch": now,
                 "config": config_data,
                 "device_id": self.device_id,
             }
 
             # Load existing backups
-            existing_data = await self._config_backup_store.async_load()
-            if not existing_data:
-                existing_data = {"backups": []}
-
-            # Add new backup
-            existing_data["backups"].append(backup_entry)
+            backups = await self._async_config_backups()
 
-            # Clean up old backups
-            cutoff_date = dt_util.utcnow() - timedelta(
-                days=self.state_backup_retention_days
-            )
-            filtered_backups: list[dict[str, Any]] = []
-            for backup in existing_data["backups"]:
-                parsed_timestamp = self._parse_timestamp(backup.get("timestamp"))
-                if parsed_timestamp and parsed_timestamp > cutoff_date:
-                    filtered_backups.append(backup)
-            existing_data["backups"] = filtered_backups
+            # Don't fill the backup ring with copies of an unchanged config
+            if backups and backups[-1].get("config") == config_data:
+                return
 
-            # Keep only the latest 10 backups
-            existing_data["backups"] = existing_data["backups"][-10:]
+            # Add new backup, then clean up old ones keeping only the latest 10.
+            # The retained list is always a fresh list here, so trim it in place.
+            backups = self._retained_config_backups([*backups, backup_entry])
+            del backups[:-10]
+            self._config_backups = backups
 
-            await self._config_backup_store.async_save(existing_data)
+            await self._config_backup_store.async_save({"backups": backups})
 
         except Exception as err:
-            _LOGGER.error("Failed to save config backup to cache: %s", err)
+            self._log_error("Failed to save config backup to cache", err)
+
+    def _retained_config_backups(
+        self, backups: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """Return the config backups newer than the retention cutoff."""
+        cutoff_ts = time.time() - self.state_backup_retention_days * SECONDS_PER_DAY
+
+        def _backup_epoch(backup: dict[str, Any]) -> float:
+            ts_epoch = backup.get("ts_epoch")
+            if ts_epoch is not None:
+                return ts_epoch
+            # Backups written before ts_epoch existed only carry the ISO string
+            parsed = self._parse_timestamp(backup.get("timestamp"))
+            return parsed.timestamp() if parsed else float("-inf")
+
+        # Backups are appended chronologically, so the retained ones are a
+        # suffix and only O(log N) timestamps need reading to find it
+        start = bisect_right(backups, cutoff_ts, key=_backup_epoch)
+        return backups[start:] if start else backups
+
+    async def _async_config_backups(self) -> list[dict[str, Any]]:
+        """Return the config backups, reading the store only on first use."""
+        if self._config_backups is None:
+            data = await self._config_backup_store.async_load()
+            self._config_backups = data.get("backups", []) if data else []
+        return self._config_backups
 
     async def async_load_config_backups(self) -> list[dict[str, Any]]:
         """Load configuration backups from persistent storage."""
         try:
-            data = await self._config_backup_store.async_load()
-            if data:
-                return data.get("backups", [])
-            return []
+            return list(await self._async_config_backups())
 
         except Exception as err:
             _LOGGER.error("Failed to load config backups from cache: %s", err)
@@ -271,70 +455,42 @@ class TsuryPhoneStorageCache:
     async def async_get_latest_config_backup(self) -> dict[str, Any] | None:
         """Get the most recent configuration backup."""
         backups = await self.async_load_config_backups()
-        if backups:
-            return max(backups, key=lambda b: b["timestamp"])
-        return None
+        # Backups are appended in chronological order, so the newest is last
+        return backups[-1] if backups else None
 
     async def _cleanup_call_history(
-        self, entries: list[CallHistoryEntry]
+        self, entries: Iterable[CallHistoryEntry]
     ) -> list[CallHistoryEntry]:
         """Clean up call history entries based on retention policies."""
         if not entries:
-            return entries
-
-        aware_min = datetime.min.replace(tzinfo=dt_util.UTC)
-
-        def _entry_timestamp(entry: CallHistoryEntry) -> datetime:
-            # NOTE: ts_device and call_start_ts are device uptime (millis()), not epoch timestamps.
-            # Always use received_ts (HA timestamp) for sorting and age comparison.
-            if entry.received_ts:
-                try:
-                    ts = dt_util.utc_from_timestamp(entry.received_ts)
-                    if ts.tzinfo:
-                        return dt_util.as_utc(ts)
-                    return ts.replace(tzinfo=dt_util.UTC)
-                except (ValueError, OSError):
-                    pass
-            return aware_min
-
-        sorted_entries = sorted(entries, key=_entry_timestamp, reverse=True)
-
-        # Apply retention policies
-        cleaned_entries = []
-        cutoff_date = dt_util.utcnow() - timedelta(
-            days=self.call_history_retention_days
-        )
-
-        for idx, entry in enumerate(sorted_entries):
-            # NOTE: ts_device and call_start_ts from firmware are device uptime in milliseconds (millis()),
-            # NOT Unix epoch timestamps! We must always use received_ts (HA timestamp) for age comparison.
-            entry_ts = None
-            if entry.received_ts:
-                try:
-                    entry_ts = dt_util.utc_from_timestamp(entry.received_ts)
-                except (ValueError, OSError):
-                    pass
-            
-            if not entry_ts:
-                cleaned_entries.append(entry)
-                continue
-            
-            # Skip entries that are too old
-            if entry_ts.tzinfo:
-                entry_ts = dt_util.as_utc(entry_ts)
-            else:
-                entry_ts = entry_ts.replace(tzinfo=dt_util.UTC)
-            
-            if entry_ts < cutoff_date:
-                continue
-
-            # Skip if we've reached max entries
-            if len(cleaned_entries) >= self.max_call_history_entries:
-                break
+            return []
 
-            cleaned_entries.append(entry)
+        # received_ts is already a UTC epoch float, so sort and compare on it
+        # directly instead of building an aware datetime per entry.
+        # NOTE: ts_device and call_start_ts from firmware are device uptime in milliseconds (millis()),
+        # NOT Unix epoch timestamps! We must always use received_ts (HA timestamp) for age comparison.
+        def _entry_timestamp(entry: CallHistoryEntry) -> float:
+            return entry.received_ts or float("-inf")
+
+        cutoff_ts = time.time() - self.call_history_retention_days * SECONDS_PER_DAY
+
+        # Drop entries that are too old, then keep the newest ones up to the
+        # cap without sorting the whole history. Entries without a
+        # received_ts are retained but rank last.
+        retained = [
+            entry
+            for entry in entries
+            if not entry.received_ts or entry.received_ts >= cutoff_ts
+        ]
+
+        if len(retained) > self.max_call_history_entries:
+            return heapq.nlargest(
+                self.max_call_history_entries, retained, key=_entry_timestamp
+            )
 
-        return cleaned_entries
+        # Everything fits under the cap: sort the filtered copy in place
+        retained.sort(key=_entry_timestamp, reverse=True)
+        return retained
 
     async def async_cleanup_storage(self) -> dict[str, int]:
         """Clean up old storage data and return cleanup statistics."""
@@ -354,31 +510,22 @@ class TsuryPhoneStorageCache:
                 stats["call_history_removed"] = original_count - len(cleaned_entries)
 
                 if stats["call_history_removed"] > 0:
-                    await self.async_save_call_history(cleaned_entries)
+                    await self.async_save_call_history(
+                        cleaned_entries, skip_cleanup=True
+                    )
 
             # Clean up config backups
             try:
-                existing_data = await self._config_backup_store.async_load()
-                if existing_data and "backups" in existing_data:
-                    original_count = len(existing_data["backups"])
-                    cutoff_date = dt_util.utcnow() - timedelta(
-                        days=self.state_backup_retention_days
-                    )
-                    filtered_backups = []
-                    for backup in existing_data["backups"]:
-                        parsed_timestamp = self._parse_timestamp(
-                            backup.get("timestamp")
-                        )
-                        if parsed_timestamp and parsed_timestamp > cutoff_date:
-                            filtered_backups.append(backup)
-                    existing_data["backups"] = filtered_backups
-
-                    stats["config_backups_removed"] = original_count - len(
-                        existing_data["backups"]
-                    )
+                backups = await self._async_config_backups()
+                if backups:
+                    retained = self._retained_config_backups(backups)
+                    stats["config_backups_removed"] = len(backups) - len(retained)
 
                     if stats["config_backups_removed"] > 0:
-                        await self._config_backup_store.async_save(existing_data)
+                        self._config_backups = retained
+                        await self._config_backup_store.async_save(
+                            {"backups": retained}
+                        )
 
             except Exception as err:
                 _LOGGER.error("Failed to clean up config backups: %s", err)
@@ -411,12 +558,9 @@ class TsuryPhoneStorageCache:
                 config_backups = await self.async_load_config_backups()
                 stats["config_backups_count"] = len(config_backups)
 
-                if config_backups:
-                    stats["latest_config_backup"] = max(
-                        config_backups, key=lambda b: b["timestamp"]
-                    )["timestamp"]
-                else:
-                    stats["latest_config_backup"] = None
+                stats["latest_config_backup"] = (
+                    config_backups[-1]["timestamp"] if config_backups else None
+                )
 
             except Exception as err:
                 stats["config_backup_error"] = str(err)
@@ -446,19 +590,33 @@ class TsuryPhoneStorageCache:
 
         if "max_call_history_entries" in settings:
             self.max_call_history_entries = settings["max_call_history_entries"]
+            self._call_history_cache = deque(
+                self._call_history_cache, maxlen=self.max_call_history_entries
+            )
 
         _LOGGER.debug("Updated retention settings: %s", settings)
 
     async def async_clear_all_storage(self) -> None:
         """Clear all storage data (use with caution)."""
         try:
-            await self._call_history_store.async_remove()
-            await self._device_state_store.async_remove()
-            await self._config_backup_store.async_remove()
+            results = await asyncio.gather(
+                self._call_history_store.async_remove(),
+                self._device_state_store.async_remove(),
+                self._config_backup_store.async_remove(),
+                return_exceptions=True,
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    raise result
 
             # Clear in-memory cache
             self._call_history_cache.clear()
             self._device_state_cache.clear()
+            self._device_state_loaded = True
+            self._config_backups = []
+            self._saved_call_history = None
+            self._pending_call_history_data = None
+            self._pending_device_state_data = None
 
             _LOGGER.warning("Cleared all storage data for device %s", self.device_id)
 
@@ -467,14 +625,22 @@ class TsuryPhoneStorageCache:
 
     async def async_export_data(self) -> dict[str, Any]:
         """Export all cached data for backup purposes."""
+        if not self._cache_loaded:
+            await self._load_cache()
+
         try:
+            device_state, config_backups, storage_stats = await asyncio.gather(
+                self.async_load_device_state(),
+                self.async_load_config_backups(),
+                self.async_get_storage_stats(),
+            )
             return {
                 "device_id": self.device_id,
-                "export_timestamp": dt_util.utcnow().isoformat(),
+                "export_timestamp": _iso_now(),
                 "call_history": [entry.to_dict() for entry in self._call_history_cache],
-                "device_state": self._device_state_cache.copy(),
-                "config_backups": await self.async_load_config_backups(),
-                "storage_stats": await self.async_get_storage_stats(),
+                "device_state": device_state,
+                "config_backups": config_backups,
+                "storage_stats": storage_stats,
             }
 
         except Exception as err:
@@ -488,20 +654,37 @@ class TsuryPhoneStorageCache:
                 _LOGGER.error("Device ID mismatch in import data")
                 return False
 
-            # Import call history
+            # Import call history. Entries are built once up front so a
+            # malformed backup is rejected before anything is written, and
+            # the retention policy applies to imported history too.
             if "call_history" in data:
-                call_history = [
-                    CallHistoryEntry.from_dict(entry) for entry in data["call_history"]
+                entries = [
+                    CallHistoryEntry.from_dict(entry)
+                    for entry in data["call_history"]
                 ]
-                await self.async_save_call_history(call_history)
+                cleaned_entries = await self._cleanup_call_history(entries)
+                self._pending_call_history_data = None
+                await self._call_history_store.async_save(
+                    {
+                        "entries": cleaned_entries,
+                        "last_updated": _iso_now(),
+                        "device_id": self.device_id,
+                    }
+                )
+                self._saved_call_history = cleaned_entries
+                self._call_history_cache.clear()
+                self._call_history_cache.extend(reversed(cleaned_entries))
+                self._cache_loaded = True
 
             # Import device state
             if "device_state" in data:
+                self._pending_device_state_data = None
                 self._device_state_cache = data["device_state"]
+                self._device_state_loaded = True
                 await self._device_state_store.async_save(
                     {
                         "state": data["device_state"],
-                        "last_updated": dt_util.utcnow().isoformat(),
+                        "last_updated": _iso_now(),
                         "device_id": self.device_id,
                     }
                 )
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
 from typing import Any
 
 from homeassistant.components.switch import SwitchEntity, SwitchEntityDescription
@@ -21,29 +23,41 @@ from .models import TsuryPhoneState
 
 _LOGGER = logging.getLogger(__name__)
 
-SWITCH_DESCRIPTIONS = (
-    SwitchEntityDescription(
+
+@dataclass(frozen=True, kw_only=True)
+class TsuryPhoneSwitchDescription(SwitchEntityDescription):
+    """Description for TsuryPhone switch entities."""
+
+    is_on_fn: Callable[[TsuryPhoneDataUpdateCoordinator], bool | None]
+
+
+SWITCH_DESCRIPTIONS: tuple[TsuryPhoneSwitchDescription, ...] = (
+    TsuryPhoneSwitchDescription(
         key="force_dnd",
         name="Force Do Not Disturb",
         icon="mdi:phone-off",
+        is_on_fn=lambda coordinator: coordinator.data.dnd_config.force,
     ),
-    SwitchEntityDescription(
+    TsuryPhoneSwitchDescription(
         key="dnd_schedule_enabled",
         name="DND Schedule Enabled",
         icon="mdi:calendar-clock",
         entity_category=EntityCategory.CONFIG,
+        is_on_fn=lambda coordinator: coordinator.data.dnd_config.scheduled,
     ),
-    SwitchEntityDescription(
+    TsuryPhoneSwitchDescription(
         key="maintenance_mode",
         name="Maintenance Mode",
         icon="mdi:wrench",
         entity_category=EntityCategory.CONFIG,
+        is_on_fn=lambda coordinator: coordinator.data.maintenance_mode,
     ),
-    SwitchEntityDescription(
+    TsuryPhoneSwitchDescription(
         key="send_mode",
         name="Send Mode",
         icon="mdi:send",
         entity_category=EntityCategory.CONFIG,
+        is_on_fn=lambda coordinator: coordinator.send_mode_enabled,
     ),
 )
 
@@ -70,10 +84,12 @@ class TsuryPhoneSwitch(
 ):
     """Representation of a TsuryPhone switch."""
 
+    entity_description: TsuryPhoneSwitchDescription
+
     def __init__(
         self,
         coordinator: TsuryPhoneDataUpdateCoordinator,
-        description: SwitchEntityDescription,
+        description: TsuryPhoneSwitchDescription,
         device_info,
     ) -> None:
         """Initialize the switch."""
@@ -81,8 +97,27 @@ class TsuryPhoneSwitch(
         self.entity_description = description
         self._device_info = device_info
 
+        # Resolve the per-key handlers once instead of comparing keys on
+        # every state read and command
+        key = description.key
+        self._setter: Callable[[bool], Awaitable[None]] = {
+            "force_dnd": self._set_dnd_force,
+            "dnd_schedule_enabled": self._set_dnd_schedule_enabled,
+            "maintenance_mode": self._set_maintenance_mode,
+            "send_mode": self._set_send_mode,
+        }[key]
+        self._attributes_fn: (
+            Callable[[TsuryPhoneState, dict[str, Any]], None] | None
+        ) = {
+            "force_dnd": self._add_force_dnd_attributes,
+            "dnd_schedule_enabled": self._add_dnd_schedule_attributes,
+            "maintenance_mode": self._add_maintenance_mode_attributes,
+        }.get(key)
+        # Send mode switch is local state and does not need the device
+        self._is_local = key == "send_mode"
+
         # Generate unique ID
-        self._attr_unique_id = f"{device_info.device_id}_{description.key}"
+        self._attr_unique_id = f"{device_info.device_id}_{key}"
 
         # Set device info
         self._attr_device_info = get_device_info(device_info)
@@ -90,44 +125,19 @@ class TsuryPhoneSwitch(
     @property
     def is_on(self) -> bool | None:
         """Return true if the switch is on."""
-        state: TsuryPhoneState = self.coordinator.data
-
-        if self.entity_description.key == "force_dnd":
-            return state.dnd_config.force
-        elif self.entity_description.key == "dnd_schedule_enabled":
-            return state.dnd_config.scheduled
-        elif self.entity_description.key == "maintenance_mode":
-            return state.maintenance_mode
-        elif self.entity_description.key == "send_mode":
-            return self.coordinator.send_mode_enabled
-
-        return None
+        return self.entity_description.is_on_fn(self.coordinator)
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the switch on."""
         try:
-            if self.entity_description.key == "force_dnd":
-                await self._set_dnd_force(True)
-            elif self.entity_description.key == "dnd_schedule_enabled":
-                await self._set_dnd_schedule_enabled(True)
-            elif self.entity_description.key == "maintenance_mode":
-                await self._set_maintenance_mode(True)
-            elif self.entity_description.key == "send_mode":
-                self._set_send_mode(True)
+            await self._setter(True)
         except TsuryPhoneAPIError as err:
             raise HomeAssistantError(f"Failed to turn on {self.name}: {err}") from err
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the switch off."""
         try:
-            if self.entity_description.key == "force_dnd":
-                await self._set_dnd_force(False)
-            elif self.entity_description.key == "dnd_schedule_enabled":
-                await self._set_dnd_schedule_enabled(False)
-            elif self.entity_description.key == "maintenance_mode":
-                await self._set_maintenance_mode(False)
-            elif self.entity_description.key == "send_mode":
-                self._set_send_mode(False)
+            await self._setter(False)
         except TsuryPhoneAPIError as err:
             raise HomeAssistantError(f"Failed to turn off {self.name}: {err}") from err
 
@@ -174,38 +184,8 @@ class TsuryPhoneSwitch(
             attributes["restored"] = True
 
         # Add specific attributes per switch type
-        if self.entity_description.key == "force_dnd":
-            # Add DND schedule info for context
-            if state.dnd_config.scheduled:
-                attributes["schedule_enabled"] = True
-                attributes["schedule_start"] = (
-                    f"{state.dnd_config.start_hour:02d}:{state.dnd_config.start_minute:02d}"
-                )
-                attributes["schedule_end"] = (
-                    f"{state.dnd_config.end_hour:02d}:{state.dnd_config.end_minute:02d}"
-                )
-            else:
-                attributes["schedule_enabled"] = False
-
-            # Show current DND active state
-            attributes["dnd_currently_active"] = state.dnd_active
-
-        elif self.entity_description.key == "dnd_schedule_enabled":
-            attributes["schedule_enabled"] = state.dnd_config.scheduled
-            attributes["schedule_start"] = (
-                f"{state.dnd_config.start_hour:02d}:{state.dnd_config.start_minute:02d}"
-            )
-            attributes["schedule_end"] = (
-                f"{state.dnd_config.end_hour:02d}:{state.dnd_config.end_minute:02d}"
-            )
-            attributes["dnd_currently_active"] = state.dnd_active
-
-        elif self.entity_description.key == "maintenance_mode":
-            # Add maintenance mode context
-            if state.maintenance_mode:
-                attributes["status"] = (
-                    "Device in maintenance mode - may affect normal operation"
-                )
+        if self._attributes_fn is not None:
+            self._attributes_fn(state, attributes)
 
         # Add connection status for troubleshooting
         if not state.connected:
@@ -218,12 +198,56 @@ class TsuryPhoneSwitch(
     def available(self) -> bool:
         """Return if entity is available."""
         # Send mode switch is always available (local state)
-        if self.entity_description.key == "send_mode":
+        if self._is_local:
             return True
         # Other switches need device connection
         return self.coordinator.last_update_success and self.coordinator.data.connected
 
-    def _set_send_mode(self, enabled: bool) -> None:
+    async def _set_send_mode(self, enabled: bool) -> None:
         """Set send mode (local integration state only)."""
         self.coordinator.set_send_mode(enabled)
         self.async_write_ha_state()
+
+    @staticmethod
+    def _add_force_dnd_attributes(
+        state: TsuryPhoneState, attributes: dict[str, Any]
+    ) -> None:
+        """Add DND schedule context to the force DND switch."""
+        # Add DND schedule info for context
+        if state.dnd_config.scheduled:
+            attributes["schedule_enabled"] = True
+            attributes["schedule_start"] = (
+                f"{state.dnd_config.start_hour:02d}:{state.dnd_config.start_minute:02d}"
+            )
+            attributes["schedule_end"] = (
+                f"{state.dnd_config.end_hour:02d}:{state.dnd_config.end_minute:02d}"
+            )
+        else:
+            attributes["schedule_enabled"] = False
+
+        # Show current DND active state
+        attributes["dnd_currently_active"] = state.dnd_active
+
+    @staticmethod
+    def _add_dnd_schedule_attributes(
+        state: TsuryPhoneState, attributes: dict[str, Any]
+    ) -> None:
+        """Add schedule window attributes to the DND schedule switch."""
+        attributes["schedule_enabled"] = state.dnd_config.scheduled
+        attributes["schedule_start"] = (
+            f"{state.dnd_config.start_hour:02d}:{state.dnd_config.start_minute:02d}"
+        )
+        attributes["schedule_end"] = (
+            f"{state.dnd_config.end_hour:02d}:{state.dnd_config.end_minute:02d}"
+        )
+        attributes["dnd_currently_active"] = state.dnd_active
+
+    @staticmethod
+    def _add_maintenance_mode_attributes(
+        state: TsuryPhoneState, attributes: dict[str, Any]
+    ) -> None:
+        """Add maintenance mode context."""
+        if state.maintenance_mode:
+            attributes["status"] = (
+                "Device in maintenance mode - may affect normal operation"
+            )
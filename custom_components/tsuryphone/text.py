@@ -6,7 +6,11 @@ operations (quick dials, blocked numbers, priority callers, and webhooks).
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass
+from enum import IntEnum
+from operator import attrgetter
+from types import MappingProxyType
 
 from homeassistant.components.text import TextEntity, TextEntityDescription
 from homeassistant.config_entries import ConfigEntry
@@ -32,6 +36,33 @@ from .dialing import sanitize_default_dialing_code
 from .validation import is_valid_ring_pattern
 
 
+# Valid range and firmware payload key for each editable DND schedule field
+_DND_FIELDS: dict[str, tuple[int, int, str]] = {
+    "start_hour": (0, 23, "startHour"),
+    "start_minute": (0, 59, "startMinute"),
+    "end_hour": (0, 23, "endHour"),
+    "end_minute": (0, 59, "endMinute"),
+}
+
+
+class TextKind(IntEnum):
+    """How a text entity reads and applies its value."""
+
+    BUFFER = 0
+    DND = 1
+    DIALING_CODE = 2
+    RING_PATTERN = 3
+
+
+# Read/write handler method names for each text kind
+_KIND_HANDLERS: dict[TextKind, tuple[str, str]] = {
+    TextKind.BUFFER: ("_buffer_value", "_async_set_buffer"),
+    TextKind.DND: ("_dnd_field_value", "_async_set_dnd_field"),
+    TextKind.DIALING_CODE: ("_dialing_code_value", "_async_set_dialing_code"),
+    TextKind.RING_PATTERN: ("_ring_pattern_value", "_async_set_ring_pattern"),
+}
+
+
 @dataclass(frozen=True, kw_only=True)
 class TsuryPhoneTextDescription(TextEntityDescription):
     """Description for TsuryPhone text entities."""
@@ -40,8 +71,7 @@ class TsuryPhoneTextDescription(TextEntityDescription):
     field_name: str
     placeholder: str | None = None
     max_length: int | None = None
-    apply_dialing_code: bool = False
-    apply_ring_pattern: bool = False
+    kind: TextKind = TextKind.BUFFER
 
 
 TEXT_DESCRIPTIONS: tuple[TsuryPhoneTextDescription, ...] = (
@@ -54,7 +84,7 @@ TEXT_DESCRIPTIONS: tuple[TsuryPhoneTextDescription, ...] = (
         buffer_name="ring_pattern",
         field_name="pattern",
         placeholder="500,500,0,500",
-        apply_ring_pattern=True,
+        kind=TextKind.RING_PATTERN,
     ),
     TsuryPhoneTextDescription(
         key="dialing_default_code",
@@ -65,7 +95,7 @@ TEXT_DESCRIPTIONS: tuple[TsuryPhoneTextDescription, ...] = (
         buffer_name="dialing",
         field_name="default_code",
         placeholder="972",
-        apply_dialing_code=True,
+        kind=TextKind.DIALING_CODE,
     ),
     TsuryPhoneTextDescription(
         key="dial_digit",
@@ -116,6 +146,7 @@ TEXT_DESCRIPTIONS: tuple[TsuryPhoneTextDescription, ...] = (
         entity_category=EntityCategory.CONFIG,
         max_length=2,
         buffer_name="dnd_schedule",
+        kind=TextKind.DND,
         field_name="start_hour",
         placeholder="22",
     ),
@@ -126,6 +157,7 @@ TEXT_DESCRIPTIONS: tuple[TsuryPhoneTextDescription, ...] = (
         entity_category=EntityCategory.CONFIG,
         max_length=2,
         buffer_name="dnd_schedule",
+        kind=TextKind.DND,
         field_name="start_minute",
         placeholder="00",
     ),
@@ -136,6 +168,7 @@ TEXT_DESCRIPTIONS: tuple[TsuryPhoneTextDescription, ...] = (
         entity_category=EntityCategory.CONFIG,
         max_length=2,
         buffer_name="dnd_schedule",
+        kind=TextKind.DND,
         field_name="end_hour",
         placeholder="07",
     ),
@@ -146,6 +179,7 @@ TEXT_DESCRIPTIONS: tuple[TsuryPhoneTextDescription, ...] = (
         entity_category=EntityCategory.CONFIG,
         max_length=2,
         buffer_name="dnd_schedule",
+        kind=TextKind.DND,
         field_name="end_minute",
         placeholder="00",
     ),
@@ -214,6 +248,26 @@ TEXT_DESCRIPTIONS: tuple[TsuryPhoneTextDescription, ...] = (
 )
 
 
+def _static_attributes(description: TsuryPhoneTextDescription) -> Mapping[str, str]:
+    """Build the helper metadata that only depends on the description."""
+    attrs: dict[str, str] = {}
+    if description.placeholder:
+        attrs["placeholder"] = description.placeholder
+    if description.kind is TextKind.RING_PATTERN:
+        attrs["hint"] = "Use commas for segments, add xN repeats, 0 for muted gaps"
+    elif description.kind is not TextKind.DIALING_CODE:
+        attrs["buffer"] = description.buffer_name
+        attrs["field"] = description.field_name
+    return MappingProxyType(attrs)
+
+
+# Computed once at import and shared by every device's entities
+TEXT_STATIC_ATTRIBUTES: dict[str, Mapping[str, str]] = {
+    description.key: _static_attributes(description)
+    for description in TEXT_DESCRIPTIONS
+}
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
@@ -245,9 +299,27 @@ class TsuryPhoneText(CoordinatorEntity[TsuryPhoneDataUpdateCoordinator], TextEnt
         super().__init__(coordinator)
         self.entity_description = description
         self._device_info = device_info
-        self._is_dnd_field = description.buffer_name == "dnd_schedule"
-        self._is_dialing_code = description.apply_dialing_code
-        self._is_ring_pattern = description.apply_ring_pattern
+        self._is_dialing_code = description.kind is TextKind.DIALING_CODE
+        # The coordinator creates its input buffers once, so resolve ours here
+        self._buffer: dict[str, str] | None = getattr(
+            coordinator, f"{description.buffer_name}_input", None
+        )
+
+        # DND fields read straight from the coordinator's DND config
+        self._field_getter = (
+            attrgetter(description.field_name)
+            if description.kind is TextKind.DND
+            else None
+        )
+
+        # The dialing code entity adds the live default prefix on top
+        self._static_attrs = TEXT_STATIC_ATTRIBUTES[description.key]
+
+        # Pick the read/write handlers once instead of re-testing the field
+        # kind on every state read and edit
+        getter_name, setter_name = _KIND_HANDLERS[description.kind]
+        self._get_impl = getattr(self, getter_name)
+        self._set_impl = getattr(self, setter_name)
 
         self._attr_unique_id = f"{device_info.device_id}_{description.key}"
         self._attr_device_info = get_device_info(device_info)
@@ -258,82 +330,75 @@ class TsuryPhoneText(CoordinatorEntity[TsuryPhoneDataUpdateCoordinator], TextEnt
     @property
     def native_value(self) -> str:
         """Return the current buffered value."""
-        if self._is_dialing_code:
-            return self.coordinator.data.default_dialing_code or ""
-
-        if self._is_ring_pattern:
-            return self.coordinator.data.ring_pattern or ""
-
-        if self._is_dnd_field:
-            dnd_config = self.coordinator.data.dnd_config
-            value = getattr(dnd_config, self.entity_description.field_name, None)
-            if value is None:
-                return ""
-            try:
-                return f"{int(value):02d}"
-            except (TypeError, ValueError):
-                return str(value)
-
-        buffer = getattr(
-            self.coordinator,
-            f"{self.entity_description.buffer_name}_input",
-            None,
-        )
-        if not buffer:
-            return ""
-        return buffer.get(self.entity_description.field_name, "")
+        return self._get_impl()
 
     async def async_set_value(self, value: str) -> None:
         """Update the buffered value and expose it to dependent buttons."""
-        if self._is_dnd_field:
-            await self._async_set_dnd_field(value)
-            return
+        await self._set_impl(value)
 
-        if self._is_dialing_code:
-            await self._async_set_dialing_code(value)
-            return
+    def _dialing_code_value(self) -> str:
+        """Return the device default dialing code."""
+        return self.coordinator.data.default_dialing_code or ""
 
-        if self._is_ring_pattern:
-            await self._async_set_ring_pattern(value)
-            return
+    def _ring_pattern_value(self) -> str:
+        """Return the device ring pattern."""
+        return self.coordinator.data.ring_pattern or ""
 
-        buffer = getattr(
-            self.coordinator,
-            f"{self.entity_description.buffer_name}_input",
-            None,
-        )
+    def _dnd_field_value(self) -> str:
+        """Return the DND schedule field as a zero-padded number."""
+        value = self._field_getter(self.coordinator.data.dnd_config)
+        if value is None:
+            return ""
+        try:
+            return f"{int(value):02d}"
+        except (TypeError, ValueError):
+            return str(value)
+
+    def _buffer_value(self) -> str:
+        """Return the value held in the coordinator input buffer."""
+        buffer = self._buffer
+        if not buffer:
+            return ""
+        return buffer.get(self.entity_description.field_name, "")
+
+    async def _async_set_buffer(self, value: str) -> None:
+        """Store the value in the coordinator input buffer."""
+        buffer = self._buffer
         if buffer is None:
             return
 
+        field_name = self.entity_description.field_name
+        current = buffer.get(field_name, "")
+
+        # Buffered values are stored already normalized, so an identical value
+        # needs no normalization and no state write
+        if value == current:
+            return
+
         # Normalize whitespace and enforce max length if provided
         normalized = value.strip()
         max_length = self.entity_description.max_length
         if max_length is not None and len(normalized) > max_length:
             normalized = normalized[:max_length]
 
-        field_name = self.entity_description.field_name
-        current = buffer.get(field_name, "")
+        # Whitespace or overflow-only edits leave the stored state untouched,
+        # but the frontend still shows the raw input until the state is rewritten
+        if normalized == current:
+            self.async_write_ha_state()
+            return
 
         buffer[field_name] = normalized
-        if current != normalized:
-            self.coordinator.async_update_listeners()
-        self.async_write_ha_state()
+        self.coordinator.async_update_listeners()
 
     @property
-    def extra_state_attributes(self) -> dict[str, str] | None:
+    def extra_state_attributes(self) -> Mapping[str, str] | None:
         """Provide helper metadata for the UI."""
-        attrs: dict[str, str] = {}
-        if self.entity_description.placeholder:
-            attrs["placeholder"] = self.entity_description.placeholder
         if self._is_dialing_code:
-            attrs["default_prefix"] = self.coordinator.data.default_dialing_prefix or ""
-            return attrs
-        if self._is_ring_pattern:
-            attrs["hint"] = "Use commas for segments, add xN repeats, 0 for muted gaps"
-            return attrs
-        attrs["buffer"] = self.entity_description.buffer_name
-        attrs["field"] = self.entity_description.field_name
-        return attrs
+            return {
+                **self._static_attrs,
+                "default_prefix": self.coordinator.data.default_dialing_prefix or "",
+            }
+        return self._static_attrs
 
     @property
     def available(self) -> bool:
@@ -348,36 +413,29 @@ class TsuryPhoneText(CoordinatorEntity[TsuryPhoneDataUpdateCoordinator], TextEnt
         if not normalized:
             raise HomeAssistantError("Enter a value before updating the schedule")
 
-        if not normalized.isdigit():
+        # Plain ASCII digits only: int() would also take signs, underscores
+        # and other Unicode digits
+        if not (normalized.isascii() and normalized.isdigit()):
             raise HomeAssistantError("Use numeric values for the DND schedule")
 
         number = int(normalized)
 
-        ranges = {
-            "start_hour": (0, 23),
-            "end_hour": (0, 23),
-            "start_minute": (0, 59),
-            "end_minute": (0, 59),
-        }
-
-        if field_name not in ranges:
+        field_spec = _DND_FIELDS.get(field_name)
+        if field_spec is None:
             raise HomeAssistantError("Unsupported DND field")
 
-        min_value, max_value = ranges[field_name]
+        min_value, max_value, payload_key = field_spec
         if not (min_value <= number <= max_value):
             raise HomeAssistantError(
                 f"Value must be between {min_value} and {max_value}"
             )
 
-        payload_field_map = {
-            "start_hour": "startHour",
-            "start_minute": "startMinute",
-            "end_hour": "endHour",
-            "end_minute": "endMinute",
-        }
-
         dnd_config = self.coordinator.data.dnd_config
-        payload = {payload_field_map[field_name]: number}
+        if getattr(dnd_config, field_name, None) == number:
+            self.async_write_ha_state()
+            return
+
+        payload = {payload_key: number}
 
         try:
             await self.coordinator.api_client.set_dnd(payload)
@@ -387,7 +445,6 @@ class TsuryPhoneText(CoordinatorEntity[TsuryPhoneDataUpdateCoordinator], TextEnt
         # Update coordinator state optimistically
         setattr(dnd_config, field_name, number)
         self.coordinator.async_update_listeners()
-        self.async_write_ha_state()
 
     async def _async_set_dialing_code(self, value: str) -> None:
         """Apply default dialing code changes immediately when edited."""
@@ -434,7 +491,6 @@ class TsuryPhoneText(CoordinatorEntity[TsuryPhoneDataUpdateCoordinator], TextEnt
         except TsuryPhoneAPIError as err:
             raise HomeAssistantError(f"Failed to update ring pattern: {err}") from err
 
+        # The coordinator broadcast re-renders this entity as well
         self.coordinator.data.ring_pattern = pattern
         self.coordinator.async_update_listeners()
-        self.async_write_ha_state()
-        self.async_write_ha_state()
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import re
 from typing import Final
 
 from .const import MAX_PATTERN_LENGTH
 
-_VALID_PATTERN_CHARS: Final = set("0123456789,x")
+# Comma-separated positive durations with an optional "xN" repeat suffix
+_RING_PATTERN_RE: Final = re.compile(r"0*[1-9][0-9]*(?:,0*[1-9][0-9]*)*(?:x([0-9]+))?")
 
 
 def _normalize_pattern(pattern: str | None) -> str:
@@ -26,31 +28,16 @@ def is_valid_ring_pattern(pattern: str | None) -> bool:
     if len(normalized) > MAX_PATTERN_LENGTH:
         return False
 
-    if any(char not in _VALID_PATTERN_CHARS for char in normalized):
+    match = _RING_PATTERN_RE.fullmatch(normalized)
+    if match is None:
         return False
 
-    base = normalized
-    repeat_count = 1
-
-    if "x" in normalized:
-        base, repeat_str = normalized.rsplit("x", 1)
-        if not repeat_str or not repeat_str.isdigit():
-            return False
-        repeat_count = int(repeat_str)
-        if repeat_count <= 0:
-            repeat_count = 1
-
-    segments = base.split(",")
-    if not segments or any(segment == "" for segment in segments):
-        return False
-
-    for segment in segments:
-        if not segment.isdigit():
-            return False
-        if int(segment) <= 0:
-            return False
+    # Commas only appear in the segment list, before any repeat suffix
+    segment_count = normalized.count(",") + 1
+    repeat_str = match.group(1)
+    repeat_count = int(repeat_str) if repeat_str else 1
 
     if repeat_count > 1:
-        return len(segments) % 2 == 0
+        return segment_count % 2 == 0
 
-    return len(segments) % 2 == 1
+    return segment_count % 2 == 1
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from copy import deepcopy
 from typing import Any
 
 from homeassistant.core import HomeAssistant
@@ -9,6 +10,27 @@ from homeassistant.core import HomeAssistant
 from .const import DOMAIN
 from .coordinator import TsuryPhoneDataUpdateCoordinator
 
+# Sample event data attached to generated webhook test payloads
+_TEST_EVENT_DATA: dict[str, dict[str, Any]] = {
+    "incoming_call": {
+        "number": "+15551234567",
+        "name": "Test Caller",
+        "call_id": "test_call_123",
+    },
+    "call_ended": {
+        "number": "+15551234567",
+        "name": "Test Caller",
+        "duration": 120,
+        "direction": "incoming",
+    },
+    "device_state_change": {
+        "old_state": "idle",
+        "new_state": "ringing",
+        "connected": True,
+    },
+    "config_change": {"section": "audio", "changes": {"earpiece_volume": 5}},
+}
+
 
 class WebhookHelper:
     """Helper class for webhook management tasks."""
@@ -61,41 +83,9 @@ class WebhookHelper:
             "sequence": 12345,
         }
 
-        if event_type == "incoming_call":
-            base_payload.update(
-                {
-                    "data": {
-                        "number": "+15551234567",
-                        "name": "Test Caller",
-                        "call_id": "test_call_123",
-                    }
-                }
-            )
-        elif event_type == "call_ended":
-            base_payload.update(
-                {
-                    "data": {
-                        "number": "+15551234567",
-                        "name": "Test Caller",
-                        "duration": 120,
-                        "direction": "incoming",
-                    }
-                }
-            )
-        elif event_type == "device_state_change":
-            base_payload.update(
-                {
-                    "data": {
-                        "old_state": "idle",
-                        "new_state": "ringing",
-                        "connected": True,
-                    }
-                }
-            )
-        elif event_type == "config_change":
-            base_payload.update(
-                {"data": {"section": "audio", "changes": {"earpiece_volume": 5}}}
-            )
+        data = _TEST_EVENT_DATA.get(event_type)
+        if data is not None:
+            base_payload["data"] = deepcopy(data)
 
         return base_payload
 
@@ -5,23 +5,26 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import random
 from typing import Any, Callable
 import time
 
 import aiohttp
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.util.json import json_loads
 
 from .const import (
     WEBSOCKET_RECONNECT_DELAY,
     WEBSOCKET_MAX_BACKOFF,
-    EVENT_QUEUE_MAX_SIZE,
     INTEGRATION_EVENT_SCHEMA_VERSION,
 )
 from .models import TsuryPhoneEvent
 
 _LOGGER = logging.getLogger(__name__)
 
+_REQUIRED_EVENT_FIELDS = frozenset({"schemaVersion", "seq", "ts", "category", "event"})
+
 EventHandler = Callable[[TsuryPhoneEvent], None]
 ConnectionStateHandler = Callable[[str, dict[str, Any]], None]
 
@@ -59,12 +62,6 @@ class TsuryPhoneWebSocketClient:
         self._last_seq = 0
         self._connection_attempts = 0
 
-        # Event processing
-        self._event_queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue(
-            maxsize=EVENT_QUEUE_MAX_SIZE
-        )
-        self._queue_overflows = 0
-
         # Statistics
         self._connect_time: float = 0
         self._disconnect_time: float = 0
@@ -74,11 +71,7 @@ class TsuryPhoneWebSocketClient:
 
         # Phase P8: Resilience improvements
         self._consecutive_failures = 0
-        self._last_pong_time = 0.0
-        self._ping_task: asyncio.Task | None = None
-        self._ping_interval = 30  # seconds
-        self._ping_timeout = 10  # seconds
-        self._last_reboot_warning = 0.0
+        self._last_reboot_warning: float | None = None
         self._reboot_warning_interval = 60  # seconds
 
     def _notify_connection_state(self, state: str) -> None:
@@ -106,14 +99,12 @@ class TsuryPhoneWebSocketClient:
             "last_seq": self._last_seq,
             "events_received": self._events_received,
             "events_processed": self._events_processed,
-            "queue_overflows": self._queue_overflows,
             "schema_mismatches": self._schema_mismatches,
             "connection_attempts": self._connection_attempts,
             "current_backoff_s": self._current_backoff,
             "connect_time": self._connect_time,
             "disconnect_time": self._disconnect_time,
             "consecutive_failures": self._consecutive_failures,
-            "last_pong_time": self._last_pong_time,
         }
 
     async def start(self) -> None:
@@ -130,32 +121,16 @@ class TsuryPhoneWebSocketClient:
         _LOGGER.debug("Stopping WebSocket client")
         self._should_reconnect = False
 
-        # Cancel reconnection attempts
-        if self._reconnect_task:
-            self._reconnect_task.cancel()
-            try:
-                await self._reconnect_task
-            except asyncio.CancelledError:
-                pass
-            self._reconnect_task = None
-
-        # Cancel listening task
-        if self._listen_task:
-            self._listen_task.cancel()
-            try:
-                await self._listen_task
-            except asyncio.CancelledError:
-                pass
-            self._listen_task = None
-
-        # Phase P8: Cancel ping task
-        if self._ping_task:
-            self._ping_task.cancel()
-            try:
-                await self._ping_task
-            except asyncio.CancelledError:
-                pass
-            self._ping_task = None
+        # Cancel reconnection attempts and listening together
+        tasks = [
+            task for task in (self._reconnect_task, self._listen_task) if task
+        ]
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        self._reconnect_task = None
+        self._listen_task = None
 
         # Close WebSocket connection
         await self._disconnect()
@@ -171,9 +146,6 @@ class TsuryPhoneWebSocketClient:
                     self._connection_attempts = 0
                     self._consecutive_failures = 0
 
-                    # Phase P8: Start ping/pong keepalive
-                    self._ping_task = asyncio.create_task(self._ping_keepalive())
-
                     # Start listening for events
                     self._listen_task = asyncio.create_task(self._listen_for_events())
                     await self._listen_task
@@ -193,8 +165,10 @@ class TsuryPhoneWebSocketClient:
                 self._connection_attempts,
             )
 
+            # Spread reconnects by +/-20% so clients that dropped together do
+            # not retry in lockstep; the reported backoff stays unjittered
             try:
-                await asyncio.sleep(self._current_backoff)
+                await asyncio.sleep(self._current_backoff * random.uniform(0.8, 1.2))
             except asyncio.CancelledError:
                 break
 
@@ -214,13 +188,15 @@ class TsuryPhoneWebSocketClient:
             self._websocket = await self._session.ws_connect(
                 self._url,
                 timeout=aiohttp.ClientTimeout(total=10),
-                heartbeat=30,  # Send ping every 30 seconds
+                # aiohttp pings every 30 seconds and closes the socket when
+                # no pong arrives, which ends the listen loop and reconnects
+                heartbeat=30,
             )
             self._connected = True
             self._connect_time = time.time()
             self._disconnect_time = 0
             self._last_seq = 0
-            self._last_reboot_warning = 0.0
+            self._last_reboot_warning = None
             _LOGGER.info("WebSocket connected successfully")
             self._notify_connection_state("connected")
 
@@ -254,7 +230,7 @@ class TsuryPhoneWebSocketClient:
         try:
             async for msg in self._websocket:
                 if msg.type == aiohttp.WSMsgType.TEXT:
-                    await self._handle_message(msg.data)
+                    self._handle_message(msg.data)
                 elif msg.type == aiohttp.WSMsgType.ERROR:
                     _LOGGER.error("WebSocket error: %s", self._websocket.exception())
                     break
@@ -269,49 +245,23 @@ class TsuryPhoneWebSocketClient:
         finally:
             await self._disconnect()
 
-    async def _handle_message(self, data: str) -> None:
+    def _handle_message(self, data: str) -> None:
         """Handle incoming WebSocket message."""
         try:
-            message = json.loads(data)
+            message = json_loads(data)
             self._events_received += 1
 
-            # Add to processing queue
-            try:
-                self._event_queue.put_nowait(message)
-            except asyncio.QueueFull:
-                self._queue_overflows += 1
-                _LOGGER.warning(
-                    "Event queue full, dropping event (overflows: %d)",
-                    self._queue_overflows,
-                )
-                # Try to make room by dropping oldest event
-                try:
-                    self._event_queue.get_nowait()
-                    self._event_queue.put_nowait(message)
-                except asyncio.QueueEmpty:
-                    pass
-
-            # Process events from queue
-            await self._process_event_queue()
+            # Messages are handled in arrival order on the listen task, so
+            # each one is dispatched as soon as it is parsed
+            self._process_event(message)
+            self._events_processed += 1
 
         except json.JSONDecodeError as err:
             _LOGGER.error("Invalid JSON received from WebSocket: %s", err)
         except Exception as err:
             _LOGGER.exception("Error handling WebSocket message: %s", err)
 
-    async def _process_event_queue(self) -> None:
-        """Process all events in the queue."""
-        while not self._event_queue.empty():
-            try:
-                raw_event = self._event_queue.get_nowait()
-                await self._process_event(raw_event)
-                self._events_processed += 1
-            except asyncio.QueueEmpty:
-                break
-            except Exception as err:
-                _LOGGER.exception("Error processing event: %s", err)
-
-    async def _process_event(self, raw_event: dict[str, Any]) -> None:
+    def _process_event(self, raw_event: dict[str, Any]) -> None:
         """Process a single event from the device."""
         try:
             # Validate basic event structure
@@ -333,9 +283,16 @@ class TsuryPhoneWebSocketClient:
             # Check sequence number for reboot detection
             seq = raw_event.get("seq", 0)
             previous_seq = self._last_seq
-            if seq <= previous_seq and previous_seq > 0:
-                now = time.time()
-                if now - self._last_reboot_warning >= self._reboot_warning_interval:
+            if seq > previous_seq:
+                self._last_seq = seq
+                self._last_reboot_warning = None
+            elif previous_seq > 0:
+                now = time.monotonic()
+                last_warning = self._last_reboot_warning
+                if (
+                    last_warning is None
+                    or now - last_warning >= self._reboot_warning_interval
+                ):
                     _LOGGER.warning(
                         "Sequence regression detected: %d <= %d (possible device reboot)",
                         seq,
@@ -351,68 +308,43 @@ class TsuryPhoneWebSocketClient:
                 # Don't drop the event, but signal potential reboot
                 raw_event["_reboot_detected"] = True
 
-            self._last_seq = max(seq, previous_seq)
-            if seq > previous_seq:
-                self._last_reboot_warning = 0.0
-
             # Convert to structured event
             event = TsuryPhoneEvent.from_json(raw_event)
 
-            # Pass to event handler
+            # Hand off to the event handler on the next loop iteration so the
+            # listen task keeps draining frames that are already buffered
             if self._event_handler:
-                self._event_handler(event)
+                self._hass.loop.call_soon(self._dispatch_event, event)
+
+        except Exception as err:
+            _LOGGER.exception("Error processing event: %s", err)
+
+    def _dispatch_event(self, event: TsuryPhoneEvent) -> None:
+        """Deliver a queued event unless the client has been stopped."""
+        if not self._should_reconnect:
+            return
 
+        try:
+            self._event_handler(event)
         except Exception as err:
             _LOGGER.exception("Error processing event: %s", err)
 
     def _validate_event_structure(self, event: dict[str, Any]) -> bool:
         """Validate basic event structure."""
-        required_fields = ["schemaVersion", "seq", "ts", "category", "event"]
-
-        for field in required_fields:
-            if field not in event:
-                _LOGGER.error("Missing required field '%s' in event", field)
-                return False
+        if event.keys() >= _REQUIRED_EVENT_FIELDS:
+            return True
 
-        return True
+        _LOGGER.error(
+            "Missing required fields %s in event",
+            sorted(_REQUIRED_EVENT_FIELDS - event.keys()),
+        )
+        return False
 
     def reset_sequence(self) -> None:
         """Reset sequence tracking (for testing or reboot recovery)."""
         _LOGGER.debug("Resetting WebSocket sequence tracking")
         self._last_seq = 0
 
-    async def _ping_keepalive(self) -> None:
-        """Send periodic ping to keep connection alive and detect stale connections."""
-        while self._connected and self._websocket:
-            try:
-                await asyncio.sleep(self._ping_interval)
-
-                if not self._connected or not self._websocket:
-                    break
-
-                # Send ping frame
-                _LOGGER.debug("Sending WebSocket ping")
-                pong_waiter = await self._websocket.ping()
-                
-                # Check if ping returned a valid waiter
-                if pong_waiter is None:
-                    _LOGGER.debug("WebSocket ping returned None - connection closed")
-                    break
-
-                try:
-                    await asyncio.wait_for(pong_waiter, timeout=self._ping_timeout)
-                    self._last_pong_time = time.time()
-                    _LOGGER.debug("Received WebSocket pong")
-
-                except asyncio.TimeoutError:
-                    _LOGGER.warning("WebSocket ping timeout - connection may be stale")
-                    # Let the connection manager handle reconnection
-                    break
-
-            except Exception as err:
-                _LOGGER.debug("Ping keepalive error: %s", err)
-                break
-
     async def disconnect(self) -> None:
         """Public method to disconnect WebSocket."""
         await self.stop()
@@ -441,15 +373,5 @@ class TsuryPhoneWebSocketClient:
         if self._consecutive_failures > 3:
             issues.append(f"High consecutive failures: {self._consecutive_failures}")
 
-        # Check stale pong
-        if self._last_pong_time > 0:
-            time_since_pong = time.time() - self._last_pong_time
-            if time_since_pong > self._ping_interval * 3:
-                issues.append(f"Stale pong response: {time_since_pong:.1f}s ago")
-
-        # Check queue overflows
-        if self._queue_overflows > 0:
-            issues.append(f"Event queue overflows: {self._queue_overflows}")
-
         is_healthy = len(issues) == 0
         return is_healthy, issues